@@ -8,6 +8,10 @@ import os
 import sys
 import warnings
 from pathlib import Path
+from typing import Optional
+
+# The script's own directory is sys.path[0], so src is importable here
+from src._bootstrap import PROJECT_ROOT, app_dir, ensure_on_path
 
 # ============================================================
 # CRITICAL: Disable Qt system theme detection BEFORE any Qt imports
@@ -33,6 +37,17 @@ except Exception:
     pass
 
 
+# Verbose startup diagnostics are only printed when RENLOC_DEBUG is set;
+# release launches skip the extra console writes.
+DEBUG = bool(os.environ.get("RENLOC_DEBUG"))
+
+
+def _debug(*args) -> None:
+    """Print a startup diagnostic line when RENLOC_DEBUG is set."""
+    if DEBUG:
+        print(*args)
+
+
 def show_error_and_wait(title: str, message: str) -> None:
     """Show error message and wait for user input (works without Qt)."""
     print(f"\n{'=' * 60}")
@@ -72,8 +87,8 @@ def check_windows_version() -> bool:
         release = platform.release()
         machine = platform.machine()
 
-        print(f"Windows Version: {release} ({version})")
-        print(f"Architecture: {machine}")
+        _debug(f"Windows Version: {release} ({version})")
+        _debug(f"Architecture: {machine}")
 
         # Check for 64-bit
         if machine not in ["AMD64", "x86_64"]:
@@ -91,11 +106,27 @@ def check_windows_version() -> bool:
         return True
 
 
+def _vcruntime_marker() -> Optional[Path]:
+    """Stamp file recording a passed VC++ runtime check for this Windows build."""
+    import platform
+
+    base = os.getenv("LOCALAPPDATA")
+    if not base:
+        return None
+    return Path(base) / "RenLocalizer" / f"vcrt_ok_{platform.version()}.stamp"
+
+
 def check_vcruntime() -> bool:
     """Check if Visual C++ Runtime is installed (Windows only)."""
     if sys.platform != "win32":
         return True
 
+    # A previous launch on this Windows build already found the runtime;
+    # skip loading the DLLs again
+    marker = _vcruntime_marker()
+    if marker is not None and marker.exists():
+        return True
+
     import ctypes
 
     # Try to load vcruntime140.dll (required by PyQt6)
@@ -105,7 +136,7 @@ def check_vcruntime() -> bool:
     for dll_name in required_dlls:
         try:
             ctypes.WinDLL(dll_name)
-            print(f"[OK] {dll_name} found")
+            _debug(f"[OK] {dll_name} found")
         except OSError:
             print(f"[MISS] {dll_name} MISSING")
             missing_dlls.append(dll_name)
@@ -123,67 +154,103 @@ def check_vcruntime() -> bool:
         )
         return False
 
-    return True
-
+    if marker is not None:
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError:
+            pass  # Best-effort cache only
 
-def get_app_dir() -> Path:
-    """Get the application directory - works for both dev and frozen exe."""
-    if getattr(sys, "frozen", False):
-        # Running as PyInstaller executable
-        return Path(sys.executable).parent
-    else:
-        # Running in development
-        return Path(__file__).parent
+    return True
 
 
-def setup_qt_environment() -> None:
-    """Setup Qt environment variables for frozen exe."""
+def _scan_meipass(root: Path) -> dict:
+    """Walk the PyInstaller bundle once and record everything the launcher needs."""
+    root_str = str(root)
+    scan = {
+        "dirs": set(),  # bundle-relative paths of every directory
+        "root_entries": [],  # (name, is_dir) for the bundle root
+        "has_pyqt6": False,
+        "pyqt6_entries": [],
+        "qt_dlls": [],  # Qt6*.dll file names in the bundle root
+        "qwindows": [],  # every qwindows.dll location
+        "platforms": [],  # every 'platforms' directory
+        "icon_ico": None,  # icon.ico in the bundle root, if bundled
+    }
+    for dirpath, dirnames, filenames in os.walk(root_str):
+        rel = os.path.relpath(dirpath, root_str)
+        scan["dirs"].add(rel)
+        if rel == ".":
+            scan["root_entries"] = [(n, True) for n in dirnames] + [(n, False) for n in filenames]
+            scan["qt_dlls"] = [n for n in filenames if n.startswith("Qt6") and n.endswith(".dll")]
+            if "icon.ico" in filenames:
+                scan["icon_ico"] = os.path.join(dirpath, "icon.ico")
+        elif rel == "PyQt6":
+            scan["has_pyqt6"] = True
+            scan["pyqt6_entries"] = dirnames + filenames
+        if os.path.basename(dirpath) == "platforms":
+            scan["platforms"].append(dirpath)
+        if "qwindows.dll" in filenames:
+            scan["qwindows"].append(os.path.join(dirpath, "qwindows.dll"))
+    return scan
+
+
+# Handles of the Qt DLLs pre-loaded by setup_qt_environment(). Kept at module
+# level so they are never garbage collected (and unloaded) before Qt starts.
+_LOADED_QT = []
+
+
+def setup_qt_environment() -> Optional[dict]:
+    """Setup Qt environment variables for frozen exe.
+
+    Returns the bundle scan from _scan_meipass() so callers can reuse it,
+    or None when not running from a PyInstaller bundle.
+    """
     if getattr(sys, "frozen", False):
         meipass = getattr(sys, "_MEIPASS", None)
         if not meipass:
-            return
+            return None
 
         meipass_path = Path(meipass)
-        print(f"MEIPASS: {meipass_path}")
+        _debug(f"MEIPASS: {meipass_path}")
+
+        # One walk over the bundle replaces the separate iterdir/glob/rglob scans
+        scan = _scan_meipass(meipass_path)
+
+        def bundle_has_dir(path: Path) -> bool:
+            return os.path.relpath(path, meipass_path) in scan["dirs"]
 
         # List contents for debugging
-        try:
+        if DEBUG:
             print("\nContents of MEIPASS root (all):")
-            all_items = sorted(meipass_path.iterdir(), key=lambda x: x.name.lower())
-            for item in all_items:
-                marker = "[DIR]" if item.is_dir() else "[FILE]"
-                print(f"  {marker} {item.name}")
+            for name, is_dir in sorted(scan["root_entries"], key=lambda x: x[0].lower()):
+                marker = "[DIR]" if is_dir else "[FILE]"
+                print(f"  {marker} {name}")
 
             # Check for PyQt6 directory
-            pyqt6_dir = meipass_path / "PyQt6"
-            if pyqt6_dir.exists():
+            if scan["has_pyqt6"]:
                 print("\nPyQt6 directory contents:")
-                for item in sorted(pyqt6_dir.iterdir()):
-                    print(f"  {item.name}")
+                for name in sorted(scan["pyqt6_entries"]):
+                    print(f"  {name}")
             else:
-                print(f"\n[WARN] PyQt6 directory NOT FOUND at {pyqt6_dir}")
+                print(f"\n[WARN] PyQt6 directory NOT FOUND at {meipass_path / 'PyQt6'}")
 
             # Check for Qt6 DLLs in root
-            qt_dlls = [f for f in meipass_path.glob("Qt6*.dll")]
-            if qt_dlls:
-                print(f"\nQt6 DLLs found in root: {len(qt_dlls)}")
-                for dll in qt_dlls[:10]:
-                    print(f"  {dll.name}")
+            if scan["qt_dlls"]:
+                print(f"\nQt6 DLLs found in root: {len(scan['qt_dlls'])}")
+                for name in scan["qt_dlls"][:10]:
+                    print(f"  {name}")
             else:
                 print("\n[WARN] No Qt6*.dll files found in root!")
 
             # Check for qwindows.dll
-            qwindows_locations = list(meipass_path.rglob("qwindows.dll"))
-            if qwindows_locations:
+            if scan["qwindows"]:
                 print("\nqwindows.dll found at:")
-                for loc in qwindows_locations:
+                for loc in scan["qwindows"]:
                     print(f"  {loc}")
             else:
                 print("\n[WARN] qwindows.dll NOT FOUND anywhere!")
 
-        except Exception as e:  # pragma: no cover - diagnostic only
-            print(f"Error listing contents: {e}")
-
         # ============================================================
         # CRITICAL: Use os.add_dll_directory() for Python 3.8+
         # This is required because Python 3.8+ changed DLL search behavior
@@ -201,17 +268,17 @@ def setup_qt_environment() -> None:
 
         # Add DLL directories using the new Python 3.8+ API
         if hasattr(os, "add_dll_directory"):
-            print("\nUsing os.add_dll_directory() (Python 3.8+ mode):")
+            _debug("\nUsing os.add_dll_directory() (Python 3.8+ mode):")
             for dll_path in dll_paths:
-                if dll_path.exists():
+                if bundle_has_dir(dll_path):
                     try:
                         os.add_dll_directory(str(dll_path))
                         dll_directories_added.append(str(dll_path))
-                        print(f"  [OK] Added: {dll_path}")
+                        _debug(f"  [OK] Added: {dll_path}")
                     except Exception as e:
                         print(f"  [WARN] Failed to add {dll_path}: {e}")
         else:
-            print("\nos.add_dll_directory() not available (Python < 3.8)")
+            _debug("\nos.add_dll_directory() not available (Python < 3.8)")
 
         # Collect all possible plugin paths
         plugin_paths = [
@@ -224,21 +291,20 @@ def setup_qt_environment() -> None:
         ]
 
         # Find existing plugin paths
-        existing_plugin_paths = [str(p) for p in plugin_paths if p.exists()]
+        existing_plugin_paths = [str(p) for p in plugin_paths if bundle_has_dir(p)]
 
         if existing_plugin_paths:
             os.environ["QT_PLUGIN_PATH"] = ";".join(existing_plugin_paths)
-            print(f"\nSet QT_PLUGIN_PATH: {os.environ['QT_PLUGIN_PATH']}")
+            _debug(f"\nSet QT_PLUGIN_PATH: {os.environ['QT_PLUGIN_PATH']}")
         else:
-            # Fallback: search for platforms directory
-            platforms_dirs = list(meipass_path.rglob("platforms"))
-            if platforms_dirs:
-                for pdir in platforms_dirs:
-                    if (pdir / "qwindows.dll").exists():
-                        parent = pdir.parent
-                        os.environ["QT_PLUGIN_PATH"] = str(parent)
-                        print(f"\nFound plugins via search: {parent}")
-                        break
+            # Fallback: use a 'platforms' directory that contains qwindows.dll
+            qwindows_dirs = {os.path.dirname(loc) for loc in scan["qwindows"]}
+            for pdir in scan["platforms"]:
+                if pdir in qwindows_dirs:
+                    parent = os.path.dirname(pdir)
+                    os.environ["QT_PLUGIN_PATH"] = parent
+                    _debug(f"\nFound plugins via search: {parent}")
+                    break
 
         # Also set PATH (as fallback for older behavior)
         lib_paths = [
@@ -250,11 +316,11 @@ def setup_qt_environment() -> None:
         ]
 
         # Build PATH with existing directories
-        existing_lib_paths = [str(p) for p in lib_paths if p.exists()]
+        existing_lib_paths = [str(p) for p in lib_paths if bundle_has_dir(p)]
         current_path = os.environ.get("PATH", "")
         os.environ["PATH"] = ";".join(existing_lib_paths) + ";" + current_path
 
-        print(f"\nAdded to PATH: {';'.join(existing_lib_paths[:3])}...")
+        _debug(f"\nAdded to PATH: {';'.join(existing_lib_paths[:3])}...")
 
         # Disable Qt debug output
         os.environ["QT_LOGGING_RULES"] = "*.debug=false"
@@ -262,41 +328,56 @@ def setup_qt_environment() -> None:
         # ============================================================
         # Try to pre-load critical DLLs manually
         # ============================================================
-        print("\nPre-loading critical DLLs...")
+        _debug("\nPre-loading critical DLLs...")
         import ctypes
 
         critical_dlls = ["Qt6Core.dll", "Qt6Gui.dll", "Qt6Widgets.dll"]
 
+        # Index every location of each DLL, in dll_paths order, with one
+        # scandir per directory (Windows file names are case-insensitive,
+        # so match lowercased)
+        wanted = {name.lower(): name for name in critical_dlls}
+        dll_index = {}
+        for dll_path in dll_paths:
+            try:
+                with os.scandir(dll_path) as entries:
+                    for entry in entries:
+                        name = wanted.get(entry.name.lower())
+                        if name:
+                            dll_index.setdefault(name, []).append(entry.path)
+            except OSError:
+                continue
+
         for dll_name in critical_dlls:
-            dll_found = False
-            for dll_path in dll_paths:
-                full_path = dll_path / dll_name
-                if full_path.exists():
-                    try:
-                        ctypes.CDLL(str(full_path))
-                        print(f"  [OK] Loaded: {dll_name} from {dll_path}")
-                        dll_found = True
-                        break
-                    except Exception as e:
-                        print(f"  [WARN] Failed to load {full_path}: {e}")
+            candidates = dll_index.get(dll_name)
+            if not candidates:
+                print(f"  [WARN] {dll_name} not found")
+                continue
+            for full_path in candidates:
+                try:
+                    # Keep the handle referenced so the library stays loaded
+                    _LOADED_QT.append(ctypes.CDLL(full_path))
+                    _debug(f"  [OK] Loaded: {dll_name} from {os.path.dirname(full_path)}")
+                    break
+                except Exception as e:
+                    print(f"  [WARN] Failed to load {full_path}: {e}")
 
-            if not dll_found:
-                root_dll = meipass_path / dll_name
-                if root_dll.exists():
-                    try:
-                        ctypes.CDLL(str(root_dll))
-                        print(f"  [OK] Loaded: {dll_name} from root")
-                    except Exception as e:
-                        print(f"  [WARN] Failed to load {root_dll}: {e}")
+        return scan
+
+    return None
 
 
 # Set working directory to app dir for consistent paths
-APP_DIR = get_app_dir()
+APP_DIR = app_dir()
 os.chdir(APP_DIR)
 
-# Add project root to Python path BEFORE any src imports
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Make sure the project root stays importable after the chdir
+ensure_on_path(PROJECT_ROOT)
+
+# Window icon for source runs, checked once; frozen builds use the bundle scan
+_ICON_PATH = None
+if not getattr(sys, "frozen", False) and (APP_DIR / "icon.ico").exists():
+    _ICON_PATH = str(APP_DIR / "icon.ico")
 
 
 def main() -> int:
@@ -305,7 +386,7 @@ def main() -> int:
     print("=" * 60)
 
     # Setup Qt environment FIRST (before any imports)
-    setup_qt_environment()
+    bundle_scan = setup_qt_environment()
 
     # Check Windows version and architecture
     if not check_windows_version():
@@ -319,17 +400,20 @@ def main() -> int:
     print("\nLoading Qt framework...")
 
     try:
-        # Import Qt FIRST to catch DLL errors early (PyQt6 only)
-        from PyQt6.QtGui import QIcon
-        from PyQt6.QtWidgets import QApplication
+        # Import Qt FIRST to catch DLL errors early (PyQt6 only).
+        # One package import, then bind the classes we need locally.
+        from PyQt6 import QtCore, QtGui, QtWidgets
+
+        QApplication = QtWidgets.QApplication
+        QIcon = QtGui.QIcon
+        Qt = QtCore.Qt
 
         qt_backend = "PyQt6"
         print(f"Using Qt backend: {qt_backend}")
 
         # Now import src modules (they will use the same Qt backend)
         from src.version import VERSION
-        from PyQt6.QtCore import Qt
-        
+
         # Create application
         app = QApplication(sys.argv)
         app.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
@@ -339,10 +423,10 @@ def main() -> int:
         # Note: FluentWindow handles its own styling, no need for Fusion style
         # app.setStyle("Fusion")
 
-        # Set application icon - use APP_DIR for frozen exe
-        icon_path = APP_DIR / "icon.ico"
-        if icon_path.exists():
-            app.setWindowIcon(QIcon(str(icon_path)))
+        # Set application icon - frozen builds reuse the bundle scan
+        icon_path = bundle_scan["icon_ico"] if bundle_scan else _ICON_PATH
+        if icon_path:
+            app.setWindowIcon(QIcon(icon_path))
 
         # ============================================================
         # THEME INITIALIZATION (CRITICAL FIX)
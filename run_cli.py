@@ -5,9 +5,12 @@ RenLocalizer CLI Launcher
 Cross-platform command line interface
 """
 
+import multiprocessing
 import os
 import sys
-from pathlib import Path
+
+# The script's own directory is sys.path[0], so src is importable here
+from src._bootstrap import PROJECT_ROOT, ensure_on_path
 
 # Ensure stdout uses UTF-8
 try:
@@ -21,9 +24,7 @@ except Exception:
 def setup_environment() -> None:
     """Setup environment variables and paths."""
     # Add project root to Python path
-    project_root = Path(__file__).parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
+    ensure_on_path(PROJECT_ROOT)
 
 def main() -> int:
     setup_environment()
@@ -42,4 +43,6 @@ def main() -> int:
         return 1
 
 if __name__ == "__main__":
+    # Needed by the process pool used for pseudo-localization in frozen builds
+    multiprocessing.freeze_support()
     sys.exit(main())
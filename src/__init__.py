@@ -2,13 +2,23 @@
 Src module for RenLocalizer V2
 =============================
 
-Note: GUI modules are not imported at package level to avoid 
-Qt import issues during PyInstaller bundling. Import them directly:
-    from src.gui.main_window import MainWindow
+Note: Subpackages are loaded lazily on first attribute access (PEP 562), so
+importing e.g. ``src.utils`` or ``src._bootstrap`` doesn't pull in the
+translation engines or Qt. GUI modules can still be imported directly:
+    from src.gui.fluent.fluent_main import FluentMainWindow
 """
 
-from . import core
-from . import utils
-# gui module is imported lazily to avoid Qt import at package level
+_LAZY = {'core': 'src.core', 'gui': 'src.gui', 'utils': 'src.utils'}
 
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        module = importlib.import_module(_LAZY[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# gui stays out of __all__ so a star-import never drags in Qt
 __all__ = ['core', 'utils']
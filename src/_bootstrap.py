@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+Launcher bootstrap helpers shared by run.py and run_cli.py.
+
+Kept free of other src imports so launchers can use it before anything
+heavy is loaded.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def ensure_on_path(path) -> None:
+    """Prepend a directory to sys.path unless it is already there."""
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+
+def app_dir() -> Path:
+    """Get the application directory - works for both dev and frozen exe."""
+    if getattr(sys, "frozen", False):
+        # Running as PyInstaller executable
+        return Path(sys.executable).parent
+    # Running in development
+    return PROJECT_ROOT
@@ -6,92 +6,198 @@ RenLocalizer CLI Main Module
 import sys
 import os
 import argparse
+import functools
+import importlib
+import importlib.util
 import signal
+import time
 import json
 import logging
+import mmap
+import re
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from PyQt6.QtCore import QCoreApplication, QTimer, QObject, pyqtSlot
+# orjson is optional; it parses/serializes JSON several times faster. Only
+# probed here - it is imported by the few code paths that write/read JSON.
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
 
-# Import core modules
-from src.utils.config import ConfigManager
-from src.core.translation_pipeline import TranslationPipeline, PipelineResult, PipelineStage
-from src.core.translator import TranslationManager, TranslationEngine, PseudoTranslator
-from src.core.proxy_manager import ProxyManager
 from src.version import VERSION
 
-# Import new tool modules
-try:
-    from src.tools.health_check import HealthChecker, run_health_check
-    from src.tools.fuzzy_matcher import FuzzyMatcher, TranslationMemory, create_common_memory
-    from src.tools.font_helper import FontHelper, check_font_for_project
-    from src.tools.context_viewer import ContextAnalyzer
-    from src.tools.deferred_loading import DeferredLoadingGenerator
-    TOOLS_AVAILABLE = True
-except ImportError as e:
-    TOOLS_AVAILABLE = False
-    print(f"Warning: Some tools not available: {e}")
-
-class CliHandler(QObject):
-    """Handles CLI events and pipeline signals."""
-    
-    def __init__(self, pipeline: TranslationPipeline, verbose: bool = False):
-        super().__init__()
-        self.pipeline = pipeline
-        self.verbose = verbose
-        
-        # Connect signals
-        self.pipeline.stage_changed.connect(self.on_stage_changed)
-        self.pipeline.progress_updated.connect(self.on_progress_updated)
-        self.pipeline.log_message.connect(self.on_log_message)
-        self.pipeline.finished.connect(self.on_finished)
-        self.pipeline.show_warning.connect(self.on_warning)
+if TYPE_CHECKING:
+    from src.core.translation_pipeline import TranslationPipeline, PipelineResult
+
+# NOTE: PyQt6 and the Qt-based translation pipeline are imported inside main()
+# only once a pipeline command is about to run, so informational commands
+# (--help, health-check, fuzzy, ...) don't pay the Qt startup cost.
+
+# Tool modules are resolved lazily (PEP 562) so that commands which don't
+# need them (translate, --help, ...) don't pay for importing them.
+_LAZY_IMPORTS = {
+    "HealthChecker": ("src.tools.health_check", "HealthChecker"),
+    "run_health_check": ("src.tools.health_check", "run_health_check"),
+    "FuzzyMatcher": ("src.tools.fuzzy_matcher", "FuzzyMatcher"),
+    "TranslationMemory": ("src.tools.fuzzy_matcher", "TranslationMemory"),
+    "create_common_memory": ("src.tools.fuzzy_matcher", "create_common_memory"),
+    "FontHelper": ("src.tools.font_helper", "FontHelper"),
+    "check_font_for_project": ("src.tools.font_helper", "check_font_for_project"),
+    "ContextAnalyzer": ("src.tools.context_viewer", "ContextAnalyzer"),
+    "DeferredLoadingGenerator": ("src.tools.deferred_loading", "DeferredLoadingGenerator"),
+}
+
+
+def __getattr__(name: str):
+    if name == "CliHandler":
+        return _build_cli_handler_class()
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = getattr(module, attr) if attr else module
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def _tools_available() -> bool:
+    """Check whether the optional tool modules can be imported."""
+    try:
+        return importlib.util.find_spec("src.tools.health_check") is not None
+    except (ImportError, ValueError):
+        return False
+
+
+_CLI_HANDLER_CLASS = None
+
+
+def _build_cli_handler_class():
+    """Define CliHandler on first use so PyQt6 is only imported when needed."""
+    global _CLI_HANDLER_CLASS
+    if _CLI_HANDLER_CLASS is not None:
+        return _CLI_HANDLER_CLASS
+
+    from PyQt6 import QtCore
+
+    QCoreApplication = QtCore.QCoreApplication
+    QObject = QtCore.QObject
+    pyqtSlot = QtCore.pyqtSlot
+
+    class CliHandler(QObject):
+        """Handles CLI events and pipeline signals."""
+    
+        def __init__(self, pipeline: "TranslationPipeline", verbose: bool = False):
+            super().__init__()
+            self.pipeline = pipeline
+            self.verbose = verbose
+
+            # Progress redraw throttling (see on_progress_updated)
+            self._last_emit = 0.0
+            self._last_percent = -1
+
+            # All slot output goes through one handle and is flushed at most
+            # every 50 ms (see _write). The pipeline runs on the GUI thread and
+            # blocks the event loop, so a QTimer-driven flush would rarely fire.
+            self._out = sys.stdout
+            self._last_flush = 0.0
         
-    @pyqtSlot(str, str)
-    def on_stage_changed(self, stage: str, message: str):
-        print(f"\n>> STAGE: {message} ({stage})")
-
-    @pyqtSlot(int, int, str)
-    def on_progress_updated(self, current: int, total: int, text: str):
-        # Print a progress bar or status line
-        percent = 0
-        if total > 0:
-            percent = int((current / total) * 100)
+            # Connect signals
+            self.pipeline.stage_changed.connect(self.on_stage_changed)
+            self.pipeline.progress_updated.connect(self.on_progress_updated)
+            self.pipeline.log_message.connect(self.on_log_message)
+            self.pipeline.finished.connect(self.on_finished)
+            self.pipeline.show_warning.connect(self.on_warning)
         
-        # Clear line and print progress
-        sys.stdout.write(f"\rProgress: [{current}/{total}] {percent}% - {text[:50].ljust(50)}")
-        sys.stdout.flush()
+        def _write(self, text: str, force_flush: bool = False):
+            self._out.write(text)
+            now = time.monotonic()
+            if force_flush or now - self._last_flush >= 0.05:
+                self._out.flush()
+                self._last_flush = now
 
-    @pyqtSlot(str, str)
-    def on_log_message(self, level: str, message: str):
-        if self.verbose or level in ["warning", "error", "critical"]:
-            print(f"\n[{level.upper()}] {message}")
-
-    @pyqtSlot(str, str)
-    def on_warning(self, title: str, message: str):
-        print(f"\n[WARNING] {title}: {message}")
-
-    @pyqtSlot(object)
-    def on_finished(self, result: PipelineResult):
-        print("\n" + "="*60)
-        if result.success:
-            print("SUCCESS")
-            print(result.message)
-            if result.stats:
-                print("\nStatistics:")
-                print(f"  Total items: {result.stats.get('total', 0)}")
-                print(f"  Translated:  {result.stats.get('translated', 0)}")
-                print(f"  Untranslated:{result.stats.get('untranslated', 0)}")
-        else:
-            print("FAILED")
-            print(result.message)
-            if result.error:
-                print(f"Details: {result.error}")
-        print("="*60)
+        @pyqtSlot(str, str)
+        def on_stage_changed(self, stage: str, message: str):
+            self._write(f"\n>> STAGE: {message} ({stage})\n")
+
+        @pyqtSlot(int, int, str)
+        def on_progress_updated(self, current: int, total: int, text: str):
+            # Print a progress bar or status line
+            percent = (current * 100) // total if total > 0 else 0
+
+            # Redraw at most ~20 times a second unless the percentage moved;
+            # the final update is always shown
+            now = time.monotonic()
+            if (percent == self._last_percent and now - self._last_emit < 0.05
+                    and current != total):
+                return
+            self._last_percent = percent
+            self._last_emit = now
+
+            # Clear line and print progress
+            text_trunc = (text[:50] + ' ' * 50)[:50]
+            self._write(f"\rProgress: [{current}/{total}] {percent}% - {text_trunc}",
+                        force_flush=current == total)
+
+        @pyqtSlot(str, str)
+        def on_log_message(self, level: str, message: str):
+            if self.verbose or level in ["warning", "error", "critical"]:
+                self._write(f"\n[{level.upper()}] {message}\n")
+
+        @pyqtSlot(str, str)
+        def on_warning(self, title: str, message: str):
+            self._write(f"\n[WARNING] {title}: {message}\n")
+
+        @pyqtSlot(object)
+        def on_finished(self, result: "PipelineResult"):
+            lines = ["", "=" * 60]
+            if result.success:
+                lines += ["SUCCESS", result.message]
+                if result.stats:
+                    lines += [
+                        "\nStatistics:",
+                        f"  Total items: {result.stats.get('total', 0)}",
+                        f"  Translated:  {result.stats.get('translated', 0)}",
+                        f"  Untranslated:{result.stats.get('untranslated', 0)}",
+                    ]
+            else:
+                lines += ["FAILED", result.message]
+                if result.error:
+                    lines.append(f"Details: {result.error}")
+            lines.append("=" * 60)
+            self._write("\n".join(str(line) for line in lines) + "\n", force_flush=True)
         
-        # Quit application
-        QCoreApplication.quit()
+            # Quit application
+            QCoreApplication.quit()
+
+    _CLI_HANDLER_CLASS = CliHandler
+    return CliHandler
+
+
+class _StatusLines:
+    """Per-file status lines for long loops, flushed at most every 50 ms.
+
+    Same rule as CliHandler._write: printing (and flushing) one line per file
+    serializes console I/O with the work, which is slow on Windows consoles.
+    """
+
+    def __init__(self, out=None):
+        self._out = out or sys.stdout
+        self._pending = []
+        self._last_flush = time.monotonic()
+
+    def line(self, text: str):
+        self._pending.append(text)
+        now = time.monotonic()
+        if now - self._last_flush >= 0.05:
+            self.flush(now)
+
+    def flush(self, now: Optional[float] = None):
+        if self._pending:
+            self._out.write("\n".join(self._pending) + "\n")
+            self._pending.clear()
+        self._out.flush()
+        self._last_flush = now if now is not None else time.monotonic()
+
 
 def setup_logging(verbose: bool):
     level = logging.DEBUG if verbose else logging.INFO
@@ -101,10 +207,31 @@ def setup_logging(verbose: bool):
         handlers=[logging.StreamHandler()]
     )
 
+@functools.lru_cache(maxsize=8)
+def _load_config_file(config_path: str, mtime_ns: int) -> dict:
+    """Parse a config file; cached per (path, mtime) so unchanged files aren't re-parsed."""
+    if ORJSON_AVAILABLE:
+        import orjson
+        with open(config_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dump_json(data, path: str) -> None:
+    """Write data as indented UTF-8 JSON (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        import orjson
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 def load_config_override(config_path: str) -> dict:
+    # NOTE: the returned dict is shared through the cache; treat it as read-only
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_config_file(config_path, os.stat(config_path).st_mtime_ns)
     except Exception as e:
         print(f"Error loading config file {config_path}: {e}")
         return {}
@@ -114,25 +241,34 @@ def load_config_override(config_path: str) -> dict:
 # NEW COMMAND HANDLERS
 # ============================================================================
 
+def _resolve_input(path_arg: str) -> Optional[Path]:
+    """Resolve a command-line path once at command entry; None if it does not exist."""
+    try:
+        return Path(path_arg).resolve(strict=True)
+    except (OSError, RuntimeError):
+        return None
+
+
 def run_health_check_command(args) -> int:
     """Run health check (static analysis) on a project."""
-    if not TOOLS_AVAILABLE:
+    if not _tools_available():
         print("Error: Health check tools not available")
         return 1
+    from src.tools.health_check import run_health_check
     
     print_header()
     print("\n  HEALTH CHECK")
     print("  " + "-"*40)
     
-    input_path = os.path.abspath(args.input_path)
-    if not os.path.exists(input_path):
-        print(f"  Error: Path not found: {input_path}")
+    input_path = _resolve_input(args.input_path)
+    if input_path is None:
+        print(f"  Error: Path not found: {Path(args.input_path).absolute()}")
         return 1
     
     print(f"  Scanning: {input_path}")
     print()
     
-    report = run_health_check(input_path, verbose=args.verbose)
+    report = run_health_check(str(input_path), verbose=args.verbose)
     
     print("\n" + "="*60)
     print(report.summary())
@@ -144,17 +280,18 @@ def run_health_check_command(args) -> int:
 
 def run_font_check_command(args) -> int:
     """Check font compatibility for a target language."""
-    if not TOOLS_AVAILABLE:
+    if not _tools_available():
         print("Error: Font check tools not available")
         return 1
+    from src.tools.font_helper import check_font_for_project
     
     print_header()
     print("\n  FONT COMPATIBILITY CHECK")
     print("  " + "-"*40)
     
-    input_path = os.path.abspath(args.input_path)
-    if not os.path.exists(input_path):
-        print(f"  Error: Path not found: {input_path}")
+    input_path = _resolve_input(args.input_path)
+    if input_path is None:
+        print(f"  Error: Path not found: {Path(args.input_path).absolute()}")
         return 1
     
     language = args.lang
@@ -162,7 +299,7 @@ def run_font_check_command(args) -> int:
     print(f"  Language: {language}")
     print()
     
-    summary = check_font_for_project(input_path, language, verbose=args.verbose)
+    summary = check_font_for_project(str(input_path), language, verbose=args.verbose)
     
     print("\n" + "="*60)
     print(f"Fonts checked: {summary['fonts_checked']}")
@@ -173,15 +310,195 @@ def run_font_check_command(args) -> int:
     return 0 if summary['incompatible_fonts'] == 0 else 1
 
 
+# What may precede a dialogue string on its line: indent and an optional speaker.
+# The bytes pattern only knows ASCII \w / \s, so prefixes with other bytes
+# (e.g. a speaker named ş or 艾琳) are decoded and matched with the str pattern.
+_DIALOGUE_PREFIX_RE = re.compile(rb'\s*(\w*)\s*')
+_DIALOGUE_PREFIX_TEXT_RE = re.compile(r'\s*(\w*)\s*')
+
+
+# TL-block shapes filled in by ``fuzzy --apply``; the quoted parts allow
+# Ren'Py escapes (\" etc.) so escaped originals are still found. Written as
+# an unrolled loop (no alternation per character) to keep the scan cheap.
+_TL_QUOTED_BODY = r'[^"\\]*(?:\\.[^"\\]*)*'
+_TL_QUOTED = '(' + _TL_QUOTED_BODY + ')'
+TL_STRINGS_RE = re.compile(r'(old\s+"' + _TL_QUOTED_BODY + r'"\s*\n\s*new\s+")' + _TL_QUOTED + r'(")')
+TL_DIALOGUE_RE = re.compile(r'(#\s*"' + _TL_QUOTED + r'"\s*\n\s*")' + _TL_QUOTED + r'(")')
+
+
+def _rewrite_tl_file(content: str, replacements: dict):
+    """Fill untranslated TL entries of one file in a single pass per block type.
+
+    ``replacements`` maps an escaped original text to its escaped translation.
+    A ``new "..."`` or dialogue line is only replaced while it still holds the
+    original text. Returns (new_content, replaced_count).
+    """
+    count = 0
+
+    def fill_string(match):
+        nonlocal count
+        translation = replacements.get(match.group(2))
+        if translation is None:
+            return match.group(0)
+        count += 1
+        return f"{match.group(1)}{translation}{match.group(3)}"
+
+    def fill_dialogue(match):
+        nonlocal count
+        original = match.group(2)
+        if match.group(3) != original:
+            return match.group(0)
+        translation = replacements.get(original)
+        if translation is None:
+            return match.group(0)
+        count += 1
+        return f"{match.group(1)}{translation}{match.group(4)}"
+
+    content = TL_STRINGS_RE.sub(fill_string, content)
+    content = TL_DIALOGUE_RE.sub(fill_dialogue, content)
+    return content, count
+
+
+def _scan_dialogue(buf):
+    """Find dialogue strings (``    e "text"`` / ``    "text"``) in a bytes-like buffer.
+
+    Jumps from quote to quote with find() and only checks the text between the
+    line start and a quote, instead of running a regex at every position.
+    Yields (keep_until, speaker, text_start, text_end): bytes before keep_until
+    are copied as-is; the speaker (bytes or None) and the non-empty text between
+    the quotes are rewritten.
+    """
+    find = buf.find
+    pos = 0
+    while True:
+        quote = find(b'"', pos)
+        if quote < 0:
+            return
+        line_start = buf.rfind(b'\n', 0, quote) + 1
+        speaker_start, speaker = _match_dialogue_prefix(buf[line_start:quote])
+        if speaker_start is None:
+            pos = quote + 1
+            continue
+        end = find(b'"', quote + 1)
+        if end < 0:
+            return
+        if end == quote + 1:
+            # Empty string - not dialogue
+            pos = end
+            continue
+        if speaker:
+            yield line_start + speaker_start, speaker, quote + 1, end
+        else:
+            yield quote, None, quote + 1, end
+        pos = end + 1
+
+
+def _match_dialogue_prefix(prefix: bytes):
+    """Match the text before a dialogue quote (indent, optional speaker).
+
+    Returns (speaker_offset, speaker_bytes) relative to the prefix, or
+    (None, None) when the prefix is not indent + speaker.
+    """
+    if prefix.isascii():
+        match = _DIALOGUE_PREFIX_RE.fullmatch(prefix)
+        if match is None:
+            return None, None
+        return match.start(1), match.group(1)
+    # surrogateescape: odd bytes never match \w / \s and round-trip unchanged
+    text = prefix.decode('utf-8', 'surrogateescape')
+    match = _DIALOGUE_PREFIX_TEXT_RE.fullmatch(text)
+    if match is None:
+        return None, None
+    offset = len(text[:match.start(1)].encode('utf-8', 'surrogateescape'))
+    return offset, match.group(1).encode('utf-8', 'surrogateescape')
+
+
+def _walk_rpy(root: str):
+    """Yield .rpy source files under root, never descending into tl/ folders."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                # Skip tl folders (existing translations)
+                if entry.name == 'tl':
+                    continue
+                yield from _walk_rpy(entry.path)
+            elif entry.name.endswith('.rpy'):
+                yield entry.path
+
+
+# Below this many files the process pool start-up costs more than it saves
+PSEUDO_POOL_MIN_FILES = 8
+PSEUDO_WRITE_BUFFER = 256 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _pseudo_translator(mode: str):
+    """One PseudoTranslator per mode and process (pool workers build their own)."""
+    from src.core.translator import PseudoTranslator
+    return PseudoTranslator(mode=mode)
+
+
+def _pseudo_one_file(rpy_file: str, input_path: str, output_dir: str, mode: str):
+    """Pseudo-localize one .rpy file into output_dir (its folder must exist).
+
+    Module-level so it can run in a ProcessPoolExecutor worker.
+    Returns (rel_path, translated_count, error_message_or_None).
+    """
+    rel_path = os.path.relpath(rpy_file, input_path)
+    output_file = os.path.join(output_dir, rel_path)
+    translator = _pseudo_translator(mode)
+    # 'expand' only wraps the text, so ASCII dialogue never needs decoding
+    expand_only = mode == 'expand'
+    count = 0
+    # Write next to the target and move it into place only once the whole
+    # file is done, so a failure never leaves a truncated .rpy behind
+    tmp_file = f"{output_file}.{os.getpid()}.tmp"
+    
+    try:
+        with open(rpy_file, 'rb') as src, \
+                open(tmp_file, 'wb', buffering=PSEUDO_WRITE_BUFFER) as out:
+            if os.fstat(src.fileno()).st_size:
+                # Stream: copy the bytes between dialogue lines straight through
+                # and only decode the dialogue text itself
+                with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    prev_end = 0
+                    for keep_until, speaker, text_start, text_end in _scan_dialogue(mm):
+                        out.write(mm[prev_end:keep_until])
+                        
+                        # Apply pseudo-localization
+                        raw = mm[text_start:text_end]
+                        if expand_only and raw.isascii() and not raw.isspace():
+                            pseudo_text = b'[!!! %s !!!]' % raw
+                        else:
+                            pseudo_text = translator._pseudo_transform(raw.decode('utf-8')).encode('utf-8')
+                        count += 1
+                        
+                        if speaker:
+                            out.write(b'%s "%s"' % (speaker, pseudo_text))
+                        else:
+                            out.write(b'"%s"' % pseudo_text)
+                        prev_end = text_end + 1
+                    out.write(mm[prev_end:])
+        os.replace(tmp_file, output_file)
+    except Exception as e:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        return rel_path, 0, str(e)
+    
+    return rel_path, count, None
+
+
 def run_pseudo_command(args) -> int:
     """Generate pseudo-localized translations for UI testing."""
     print_header()
     print("\n  PSEUDO-LOCALIZATION")
     print("  " + "-"*40)
     
-    input_path = os.path.abspath(args.input_path)
-    if not os.path.exists(input_path):
-        print(f"  Error: Path not found: {input_path}")
+    input_path = _resolve_input(args.input_path)
+    if input_path is None:
+        print(f"  Error: Path not found: {Path(args.input_path).absolute()}")
         return 1
     
     mode = args.mode
@@ -189,36 +506,27 @@ def run_pseudo_command(args) -> int:
     print(f"  Mode: {mode}")
     
     # Determine output directory
+    is_file = input_path.is_file()
     if args.output:
         output_dir = os.path.abspath(args.output)
     else:
         # Default to tl/pseudo
-        if os.path.isfile(input_path):
-            base = os.path.dirname(input_path)
-        else:
-            base = input_path
-        output_dir = os.path.join(base, "game", "tl", "pseudo")
+        base = input_path.parent if is_file else input_path
+        output_dir = str(base / "game" / "tl" / "pseudo")
+    # Output mirrors the layout below the input folder (or the file's folder)
+    source_root = str(input_path.parent if is_file else input_path)
     
     print(f"  Output: {output_dir}")
     print()
     
-    # Create PseudoTranslator
-    translator = PseudoTranslator(mode=mode)
-    
     # Find .rpy files to process
     rpy_files = []
-    if os.path.isfile(input_path) and input_path.endswith('.rpy'):
-        rpy_files = [input_path]
+    if is_file and input_path.suffix == '.rpy':
+        rpy_files = [str(input_path)]
     else:
-        game_dir = os.path.join(input_path, 'game')
-        if os.path.isdir(game_dir):
-            for root, dirs, files in os.walk(game_dir):
-                # Skip tl folders
-                if '/tl/' in root.replace('\\', '/') or '\\tl\\' in root:
-                    continue
-                for f in files:
-                    if f.endswith('.rpy'):
-                        rpy_files.append(os.path.join(root, f))
+        game_dir = input_path / 'game'
+        if game_dir.is_dir():
+            rpy_files = list(_walk_rpy(str(game_dir)))
     
     if not rpy_files:
         print("  No .rpy files found to process.")
@@ -228,52 +536,44 @@ def run_pseudo_command(args) -> int:
     print(f"  Found {len(rpy_files)} .rpy files")
     print()
     
-    # Process each file
-    import re
-    dialogue_pattern = re.compile(r'^(\s*)(\w+)?\s*"([^"]+)"', re.MULTILINE)
+    # Process each file (independent of each other, so fan out on larger projects)
     translated_count = 0
     
-    os.makedirs(output_dir, exist_ok=True)
+    # Create every output folder once up front instead of once per file
+    dirs_needed = {
+        os.path.dirname(os.path.join(output_dir, os.path.relpath(f, source_root)))
+        for f in rpy_files
+    }
+    dirs_needed.add(output_dir)
+    for directory in sorted(dirs_needed):
+        os.makedirs(directory, exist_ok=True)
+    
+    jobs = len(rpy_files)
+    if jobs < PSEUDO_POOL_MIN_FILES:
+        results = (_pseudo_one_file(f, source_root, output_dir, mode) for f in rpy_files)
+        pool = None
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        results = pool.map(
+            _pseudo_one_file, rpy_files,
+            repeat(source_root, jobs), repeat(output_dir, jobs), repeat(mode, jobs),
+            chunksize=8,
+        )
     
-    for rpy_file in rpy_files:
-        rel_path = os.path.relpath(rpy_file, input_path)
-        output_file = os.path.join(output_dir, rel_path)
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        
-        try:
-            with open(rpy_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract and pseudo-translate dialogues
-            translations = []
-            
-            def pseudo_replace(match):
-                nonlocal translated_count
-                indent = match.group(1) or ""
-                speaker = match.group(2) or ""
-                text = match.group(3)
-                
-                # Apply pseudo-localization
-                pseudo_text = translator._apply_pseudo(text)
-                translated_count += 1
-                
-                if speaker:
-                    return f'{indent}{speaker} "{pseudo_text}"'
-                else:
-                    return f'{indent}"{pseudo_text}"'
-            
-            # Transform content
-            pseudo_content = dialogue_pattern.sub(pseudo_replace, content)
-            
-            # Write output
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(pseudo_content)
-            
+    status = _StatusLines()
+    try:
+        for rel_path, count, error in results:
+            if error:
+                status.line(f"  ✗ Error processing {rel_path}: {error}")
+                continue
+            translated_count += count
             if args.verbose:
-                print(f"  ✓ {rel_path}")
-        
-        except Exception as e:
-            print(f"  ✗ Error processing {rel_path}: {e}")
+                status.line(f"  ✓ {rel_path}")
+    finally:
+        status.flush()
+        if pool is not None:
+            pool.shutdown()
     
     print()
     print(f"  ✅ Pseudo-localized {translated_count} strings")
@@ -289,22 +589,23 @@ def run_pseudo_command(args) -> int:
 
 def run_fuzzy_command(args) -> int:
     """Run fuzzy matching to recover translations."""
-    if not TOOLS_AVAILABLE:
+    if not _tools_available():
         print("Error: Fuzzy matching tools not available")
         return 1
+    from src.tools.fuzzy_matcher import FuzzyMatcher
     
     print_header()
     print("\n  FUZZY MATCHING (Smart Update)")
     print("  " + "-"*40)
     
-    old_tl = os.path.abspath(args.old_tl)
-    new_tl = os.path.abspath(args.new_tl)
+    old_tl = _resolve_input(args.old_tl)
+    new_tl = _resolve_input(args.new_tl)
     
-    if not os.path.exists(old_tl):
-        print(f"  Error: Old TL path not found: {old_tl}")
+    if old_tl is None:
+        print(f"  Error: Old TL path not found: {Path(args.old_tl).absolute()}")
         return 1
-    if not os.path.exists(new_tl):
-        print(f"  Error: New TL path not found: {new_tl}")
+    if new_tl is None:
+        print(f"  Error: New TL path not found: {Path(args.new_tl).absolute()}")
         return 1
     
     threshold = args.threshold
@@ -318,10 +619,10 @@ def run_fuzzy_command(args) -> int:
     parser = TLParser()
     
     print("  Parsing old translations...")
-    old_files = parser.parse_directory(os.path.dirname(old_tl), os.path.basename(old_tl))
+    old_files = parser.parse_directory(str(old_tl.parent), old_tl.name, use_cache=True)
     
     print("  Parsing new translations...")
-    new_files = parser.parse_directory(os.path.dirname(new_tl), os.path.basename(new_tl))
+    new_files = parser.parse_directory(str(new_tl.parent), new_tl.name, use_cache=True)
     
     # Build entry dicts
     old_entries = {}
@@ -351,94 +652,70 @@ def run_fuzzy_command(args) -> int:
     if args.verbose:
         print("\n  Matches found:")
         for match in report.matches[:20]:  # Show first 20
-            status = "✓" if match.is_confident() else "?"
+            status = "✓" if match.confident else "?"
             print(f"    [{status}] {match.similarity_percent}%: \"{match.new_original[:40]}...\"")
     
-    if args.apply and report.auto_apply_count > 0:
-        print(f"\n  Applying {report.auto_apply_count} confident matches...")
+    auto_apply_count = report.auto_apply_count
+    if args.apply and auto_apply_count > 0:
+        print(f"\n  Applying {auto_apply_count} confident matches...")
         
-        # Build a map of new_id -> suggested translation (only confident matches)
+        # One pass over the matches: new_id -> suggested translation for the
+        # confident ones, plus the rows exported to fuzzy_suggestions.json
         suggestions = {}
+        export_data = []
         for match in report.matches:
-            if match.is_confident(threshold):
+            confident = match.confident
+            if confident:
                 suggestions[match.new_id] = match.old_translation
+            export_data.append({
+                "new_id": match.new_id,
+                "new_original": match.new_original,
+                "suggested": match.old_translation,
+                "similarity": match.similarity_percent,
+                "auto_applied": confident
+            })
         
-        # Apply to files
+        # Apply to files: one rewrite pass per file instead of one regex per entry
         applied_count = 0
+        status = _StatusLines()
         for file_path, entries in new_entries_by_file.items():
-            file_modified = False
+            replacements = {
+                parser._escape_string(entry.original_text): parser._escape_string(suggestions[trans_id])
+                for trans_id, entry in entries.items()
+                if trans_id in suggestions
+            }
+            if not replacements:
+                continue
             
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
-                for trans_id, entry in entries.items():
-                    if trans_id in suggestions:
-                        new_translation = suggestions[trans_id]
-                        
-                        # Find and replace in content
-                        # Pattern: look for the translation block and replace the translated text
-                        import re
-                        
-                        # Try to find the entry and update it
-                        # Look for: "original_text" and replace the next quoted line
-                        old_pattern = re.escape(entry.original_text)
-                        
-                        # If the file contains this original text followed by untranslated version
-                        if entry.original_text in content:
-                            # Simple replacement: find empty translation and fill it
-                            # Look for patterns like:    old "text"\n    new "text"  -> new "translation"
-                            pattern = rf'(old\s+"[^"]*"\s*\n\s*new\s+")({re.escape(entry.original_text)})(")'
-                            replacement = rf'\g<1>{new_translation}\g<3>'
-                            new_content, count = re.subn(pattern, replacement, content)
-                            
-                            if count > 0:
-                                content = new_content
-                                file_modified = True
-                                applied_count += 1
-                            else:
-                                # Try simple format: # "original"\n    "original" -> "translation"
-                                pattern2 = rf'(#\s*"{re.escape(entry.original_text)}"\s*\n\s*")({re.escape(entry.original_text)})(")'
-                                replacement2 = rf'\g<1>{new_translation}\g<3>'
-                                new_content, count = re.subn(pattern2, replacement2, content)
-                                if count > 0:
-                                    content = new_content
-                                    file_modified = True
-                                    applied_count += 1
+                content, count = _rewrite_tl_file(content, replacements)
                 
-                if file_modified:
+                if count:
+                    applied_count += count
                     with open(file_path, 'w', encoding='utf-8') as f:
                         f.write(content)
                     if args.verbose:
-                        print(f"    ✓ Updated: {os.path.basename(file_path)}")
+                        status.line(f"    ✓ Updated: {os.path.basename(file_path)}")
             
             except Exception as e:
-                print(f"    ✗ Error updating {file_path}: {e}")
+                status.line(f"    ✗ Error updating {file_path}: {e}")
+        status.flush()
         
         print(f"\n  ✅ Applied {applied_count} translations")
         
         # Also export suggestions to JSON
-        suggestions_file = os.path.join(new_tl, "fuzzy_suggestions.json")
+        suggestions_file = str(new_tl / "fuzzy_suggestions.json")
         try:
-            import json
-            with open(suggestions_file, 'w', encoding='utf-8') as f:
-                export_data = [
-                    {
-                        "new_id": m.new_id,
-                        "new_original": m.new_original,
-                        "suggested": m.old_translation,
-                        "similarity": m.similarity_percent,
-                        "auto_applied": m.is_confident(threshold)
-                    }
-                    for m in report.matches
-                ]
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            _dump_json(export_data, suggestions_file)
             print(f"  📁 Suggestions exported to: {suggestions_file}")
         except Exception as e:
             print(f"  ⚠ Could not export suggestions: {e}")
     
-    elif report.auto_apply_count > 0:
-        print(f"\n  💡 {report.auto_apply_count} translations can be auto-applied.")
+    elif auto_apply_count > 0:
+        print(f"\n  💡 {auto_apply_count} translations can be auto-applied.")
         print("  Use --apply flag to apply them:")
         print(f"    python run_cli.py fuzzy {args.old_tl} {args.new_tl} --apply")
     
@@ -456,15 +733,15 @@ def run_extract_glossary_command(args) -> int:
     print("\n  GLOSSARY EXTRACTOR")
     print("  " + "-"*40)
     
-    input_path = os.path.abspath(args.input_path)
-    if not os.path.exists(input_path):
-        print(f"  Error: Path not found: {input_path}")
+    input_path = _resolve_input(args.input_path)
+    if input_path is None:
+        print(f"  Error: Path not found: {Path(args.input_path).absolute()}")
         return 1
         
     print(f"  Scanning: {input_path}")
     
     extractor = GlossaryExtractor()
-    terms = extractor.extract_from_directory(input_path, min_occurrence=args.min_count)
+    terms = extractor.extract_from_directory(str(input_path), min_occurrence=args.min_count)
     
     if not terms:
         print("\n  No terms found.")
@@ -478,8 +755,7 @@ def run_extract_glossary_command(args) -> int:
         output_file = os.path.join(os.getcwd(), "glossary_extracted.json")
         
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(terms, f, ensure_ascii=False, indent=2)
+        _dump_json(terms, output_file)
         print(f"  ✅ Saved to: {output_file}")
     except Exception as e:
         print(f"  ✗ Error saving file: {e}")
@@ -487,9 +763,39 @@ def run_extract_glossary_command(args) -> int:
         
     return 0
 
+_VT_ENABLED: Optional[bool] = None
+
+
+def _enable_vt_mode() -> bool:
+    """Make sure the console understands ANSI escapes (Windows 10+ needs opting in)."""
+    global _VT_ENABLED
+    if _VT_ENABLED is None:
+        if os.name != 'nt':
+            _VT_ENABLED = True
+        else:
+            try:
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+                mode = ctypes.c_uint32()
+                _VT_ENABLED = bool(
+                    kernel32.GetConsoleMode(handle, ctypes.byref(mode))
+                    # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                    and kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+                )
+            except Exception:
+                _VT_ENABLED = False
+    return _VT_ENABLED
+
+
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _enable_vt_mode():
+        # ANSI clear + cursor home; no 'cls'/'clear' subprocess per screen
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
 
 def print_header():
     """Print the CLI header."""
@@ -500,13 +806,12 @@ def print_header():
 
 def print_menu(title: str, options: list, show_back: bool = True) -> int:
     """Display a menu and get user selection."""
-    print(f"\n  {title}")
-    print("  " + "-"*40)
-    for i, option in enumerate(options, 1):
-        print(f"    [{i}] {option}")
+    lines = [f"\n  {title}", "  " + "-"*40]
+    lines.extend(f"    [{i}] {option}" for i, option in enumerate(options, 1))
     if show_back:
-        print(f"    [0] Back")
-    print()
+        lines.append("    [0] Back")
+    lines.append("")
+    print("\n".join(lines))
     
     while True:
         try:
@@ -527,6 +832,35 @@ def get_input(prompt: str, default: str = "") -> str:
         return result if result else default
     return input(f"  {prompt}: ").strip()
 
+# Static interactive menus (built once, not on every loop iteration)
+MAIN_MENU_OPTIONS = (
+    "Full Translation (Game EXE/Project)",
+    "Translate Existing TL Folder",
+    "Settings",
+    "Help",
+    "Exit",
+)
+LANGUAGE_CODES = ('tr', 'en', 'fr', 'de', 'es', 'ru', 'ja', 'ko', 'zh')
+LANGUAGE_MENU_OPTIONS = (
+    "Turkish (tr)",
+    "English (en)",
+    "French (fr)",
+    "German (de)",
+    "Spanish (es)",
+    "Russian (ru)",
+    "Japanese (ja)",
+    "Korean (ko)",
+    "Chinese (zh)",
+    "Other (enter manually)",
+)
+MODES = ('auto', 'full', 'translate')
+MODE_MENU_OPTIONS = (
+    "Auto (Recommended)",
+    "Full (UnRen + Translation - Windows Only)",
+    "Translate Only",
+)
+
+
 def interactive_mode() -> dict:
     """Run interactive setup wizard."""
     config = {
@@ -544,13 +878,7 @@ def interactive_mode() -> dict:
     
     # Main Menu
     while True:
-        choice = print_menu("MAIN MENU", [
-            "Full Translation (Game EXE/Project)",
-            "Translate Existing TL Folder",
-            "Settings",
-            "Help",
-            "Exit"
-        ], show_back=False)
+        choice = print_menu("MAIN MENU", MAIN_MENU_OPTIONS, show_back=False)
         
         if choice == 1:  # Full Translation
             # Get input path
@@ -573,42 +901,25 @@ def interactive_mode() -> dict:
             # Get target language
             print("\n  STEP 2: Target Language")
             print("  " + "-"*40)
-            lang_choice = print_menu("Select target language", [
-                "Turkish (tr)",
-                "English (en)",
-                "French (fr)",
-                "German (de)",
-                "Spanish (es)",
-                "Russian (ru)",
-                "Japanese (ja)",
-                "Korean (ko)",
-                "Chinese (zh)",
-                "Other (enter manually)"
-            ], show_back=True)
+            lang_choice = print_menu("Select target language", LANGUAGE_MENU_OPTIONS, show_back=True)
             
             if lang_choice == 0:
                 continue
             
-            lang_codes = ['tr', 'en', 'fr', 'de', 'es', 'ru', 'ja', 'ko', 'zh']
-            if lang_choice <= 9:
-                config['target_lang'] = lang_codes[lang_choice - 1]
+            if lang_choice <= len(LANGUAGE_CODES):
+                config['target_lang'] = LANGUAGE_CODES[lang_choice - 1]
             else:
                 config['target_lang'] = get_input("Language code", "tr")
             
             # Get mode
             print("\n  STEP 3: Operation Mode")
             print("  " + "-"*40)
-            mode_choice = print_menu("Select mode", [
-                "Auto (Recommended)",
-                "Full (UnRen + Translation - Windows Only)",
-                "Translate Only"
-            ], show_back=True)
+            mode_choice = print_menu("Select mode", MODE_MENU_OPTIONS, show_back=True)
             
             if mode_choice == 0:
                 continue
             
-            modes = ['auto', 'full', 'translate']
-            config['mode'] = modes[mode_choice - 1]
+            config['mode'] = MODES[mode_choice - 1]
             
             # Confirm and start
             clear_screen()
@@ -648,25 +959,13 @@ def interactive_mode() -> dict:
             # Get target language
             print("\n  Target Language")
             print("  " + "-"*40)
-            lang_choice = print_menu("Select target language", [
-                "Turkish (tr)",
-                "English (en)",
-                "French (fr)",
-                "German (de)",
-                "Spanish (es)",
-                "Russian (ru)",
-                "Japanese (ja)",
-                "Korean (ko)",
-                "Chinese (zh)",
-                "Other (enter manually)"
-            ], show_back=True)
+            lang_choice = print_menu("Select target language", LANGUAGE_MENU_OPTIONS, show_back=True)
             
             if lang_choice == 0:
                 continue
             
-            lang_codes = ['tr', 'en', 'fr', 'de', 'es', 'ru', 'ja', 'ko', 'zh']
-            if lang_choice <= 9:
-                config['target_lang'] = lang_codes[lang_choice - 1]
+            if lang_choice <= len(LANGUAGE_CODES):
+                config['target_lang'] = LANGUAGE_CODES[lang_choice - 1]
             else:
                 config['target_lang'] = get_input("Language code", "tr")
             
@@ -746,26 +1045,34 @@ def interactive_mode() -> dict:
     
     return config
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description=f"RenLocalizer V{VERSION} CLI")
+def _translate_options_parser() -> argparse.ArgumentParser:
+    """Options shared by the 'translate' command and the legacy no-command form."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--config", help="Path to JSON configuration file to override settings")
+    common.add_argument("--target-lang", "-t", default="tr", help="Target language code (default: tr)")
+    common.add_argument("--source-lang", "-s", default="auto", help="Source language code (default: auto)")
+    common.add_argument("--engine", "-e", default="google", choices=["google", "deepl", "pseudo"], help="Translation engine (pseudo for UI testing)")
+    common.add_argument("--mode", choices=["auto", "full", "translate"], default="auto", 
+                        help="Operation mode: 'auto' (detect), 'full' (UnRen+Trans), 'translate' (Trans only)")
+    common.add_argument("--proxy", action="store_true", help="Enable proxy")
+    common.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    common.add_argument("--interactive", "-i", action="store_true", help="Run in interactive menu mode")
+    common.add_argument("--deep-scan", "-d", action="store_true", help="Enable deep scanning (AST/RPYC analysis)")
+    common.add_argument("--rpyc", action="store_true", help="Enable RPYC reader (experimental)")
+    return common
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    translate_options = _translate_options_parser()
+    parser = argparse.ArgumentParser(description=f"RenLocalizer V{VERSION} CLI", parents=[translate_options])
     
     # Create subparsers for different commands
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # TRANSLATE command (default)
-    translate_parser = subparsers.add_parser('translate', help='Translate a game or project')
+    translate_parser = subparsers.add_parser('translate', help='Translate a game or project', parents=[translate_options])
     translate_parser.add_argument("input_path", nargs='?', default=None, 
                         help="Path to game executable, project directory, or translation file")
-    translate_parser.add_argument("--config", help="Path to JSON configuration file")
-    translate_parser.add_argument("--target-lang", "-t", default="tr", help="Target language code (default: tr)")
-    translate_parser.add_argument("--source-lang", "-s", default="auto", help="Source language code (default: auto)")
-    translate_parser.add_argument("--engine", "-e", default="google", choices=["google", "deepl", "pseudo"], help="Translation engine (pseudo for UI testing)")
-    translate_parser.add_argument("--mode", choices=["auto", "full", "translate"], default="auto", 
-                        help="Operation mode: 'auto' (detect), 'full' (UnRen+Trans), 'translate' (Trans only)")
-    translate_parser.add_argument("--proxy", action="store_true", help="Enable proxy")
-    translate_parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
-    translate_parser.add_argument("--interactive", "-i", action="store_true", help="Run in interactive menu mode")
-    translate_parser.add_argument("--deep-scan", "-d", action="store_true", help="Enable deep scanning (AST/RPYC analysis)")
     
     # HEALTH-CHECK command
     health_parser = subparsers.add_parser('health-check', help='Run static analysis on project')
@@ -800,24 +1107,20 @@ def main() -> int:
     glossary_parser.add_argument("--min-count", type=int, default=3, help="Minimum occurrence for common terms")
     glossary_parser.add_argument("--output", "-o", help="Output JSON file (default: glossary_extracted.json)")
     
-    # Legacy support: Add arguments directly to main parser for backwards compatibility
-    # These are used when no subcommand is specified
+    # Legacy support: the translate options above are also on the main parser
+    # (via parents) and are used when no subcommand is specified
     # NOTE: Use 'legacy_input_path' to avoid argparse conflict with subparser 'input_path'
     parser.add_argument("legacy_input_path", nargs='?', default=None, metavar='input_path',
                         help="Path to game executable, project directory, or translation file")
-    parser.add_argument("--config", help="Path to JSON configuration file to override settings")
-    parser.add_argument("--target-lang", "-t", default="tr", help="Target language code (default: tr)")
-    parser.add_argument("--source-lang", "-s", default="auto", help="Source language code (default: auto)")
-    parser.add_argument("--engine", "-e", default="google", choices=["google", "deepl", "pseudo"], help="Translation engine")
-    parser.add_argument("--mode", choices=["auto", "full", "translate"], default="auto", 
-                        help="Operation mode: 'auto' (detect), 'full' (UnRen+Trans), 'translate' (Trans only)")
-    parser.add_argument("--proxy", action="store_true", help="Enable proxy")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
-    parser.add_argument("--interactive", "-i", action="store_true", help="Run in interactive menu mode")
-    parser.add_argument("--deep-scan", action="store_true", help="Enable deep scanning")
-    parser.add_argument("--rpyc", action="store_true", help="Enable RPYC reader (experimental)")
-    
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import; main() only parses
+_PARSER = _build_parser()
+
+
+def main() -> int:
+    args = _PARSER.parse_args()
     
     # Normalize: If using legacy mode (no subcommand), copy legacy_input_path to input_path
     if args.command is None and hasattr(args, 'legacy_input_path'):
@@ -861,6 +1164,16 @@ def main() -> int:
             args.proxy = interactive_config['proxy']
             args.verbose = interactive_config['verbose']
 
+    # Only the pipeline needs Qt; import it now that we know we're running one
+    from PyQt6 import QtCore
+    QCoreApplication = QtCore.QCoreApplication
+    QTimer = QtCore.QTimer
+    from src.utils.config import ConfigManager
+    from src.core.translation_pipeline import TranslationPipeline
+    from src.core.translator import TranslationManager, TranslationEngine
+    from src.core.proxy_manager import ProxyManager
+    CliHandler = _build_cli_handler_class()
+
     # Create config manager
     config_manager = ConfigManager()
     
@@ -6,12 +6,46 @@ a JSON report summarizing counts and per-file details.
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # optional: stdlib json is used instead
+    ORJSON_AVAILABLE = False
 
-@dataclass
+# Reports hold one FileReport per scanned file: drop the per-instance __dict__
+# where dataclasses support it (Python 3.10+; 3.8/3.9 keep plain dataclasses).
+_DATACLASS_OPTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Entries are stored as compact tuples ``(status, ...)`` and only turned into
+# dicts by to_dict(); a report can hold one event per extracted string.
+_ST_EXTRACTED, _ST_TRANSLATED, _ST_WRITTEN, _ST_SKIPPED, _ST_UNCHANGED = range(5)
+
+
+def _entry_dict(entry: Tuple) -> Dict[str, Any]:
+    status = entry[0]
+    if status == _ST_EXTRACTED:
+        return {**entry[1], 'status': 'extracted'}
+    if status == _ST_WRITTEN:
+        return {'translation_id': entry[1], 'status': 'written'}
+    if status == _ST_TRANSLATED:
+        rec = {'translation_id': entry[1], 'translated_text': entry[2], 'status': 'translated'}
+        if entry[3] is not None:
+            rec['original_text'] = entry[3]
+        return rec
+    if status == _ST_SKIPPED:
+        return {'status': 'skipped', 'reason': entry[1], **(entry[2] or {})}
+    rec = {'translation_id': entry[1], 'status': 'unchanged'}
+    if entry[2] is not None:
+        rec['original_text'] = entry[2]
+    return rec
+
+
+@dataclass(**_DATACLASS_OPTS)
 class FileReport:
     file_path: str
     extracted: int = 0
@@ -19,10 +53,10 @@ class FileReport:
     written: int = 0
     skipped: int = 0
     unchanged: int = 0
-    entries: List[Dict[str, Any]] = field(default_factory=list)
+    entries: List[Tuple] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class DiagnosticReport:
     project: str = ''
     target_language: str = ''
@@ -33,65 +67,42 @@ class DiagnosticReport:
     total_unchanged: int = 0
     files: Dict[str, FileReport] = field(default_factory=dict)
 
-    def add_extracted(self, file_path: str, entry: Dict[str, Any]):
+    def _file_report(self, file_path: str) -> FileReport:
         fr = self.files.get(file_path)
-        if not fr:
-            fr = FileReport(file_path=file_path)
-            self.files[file_path] = fr
+        if fr is None:
+            fr = self.files[file_path] = FileReport(file_path=file_path)
+        return fr
+
+    def add_extracted(self, file_path: str, entry: Dict[str, Any]):
+        fr = self._file_report(file_path)
         fr.extracted += 1
-        rec = {**entry, 'status': 'extracted'}
-        # include raw_text if available for ID/debug matching
-        if 'raw_text' in entry and entry.get('raw_text') is not None:
-            rec['raw_text'] = entry.get('raw_text')
-        # If a translation_id is supplied or can be computed externally, include it.
-        if 'translation_id' in entry and entry.get('translation_id'):
-            rec['translation_id'] = entry.get('translation_id')
-        fr.entries.append(rec)
+        # entry is kept as-is (not copied): raw_text, translation_id, ... are
+        # reported for ID/debug matching
+        fr.entries.append((_ST_EXTRACTED, entry))
         self.total_extracted += 1
 
     def mark_translated(self, file_path: str, translation_id: str, translated_text: str, original_text: str = None):
-        fr = self.files.get(file_path)
-        if not fr:
-            fr = FileReport(file_path=file_path)
-            self.files[file_path] = fr
+        fr = self._file_report(file_path)
         fr.translated += 1
-        rec = {'translation_id': translation_id, 'translated_text': translated_text, 'status': 'translated'}
-        if original_text is not None:
-            rec['original_text'] = original_text
-        fr.entries.append(rec)
+        fr.entries.append((_ST_TRANSLATED, translation_id, translated_text, original_text))
         self.total_translated += 1
 
     def mark_written(self, file_path: str, translation_id: str):
-        fr = self.files.get(file_path)
-        if not fr:
-            fr = FileReport(file_path=file_path)
-            self.files[file_path] = fr
+        fr = self._file_report(file_path)
         fr.written += 1
-        fr.entries.append({'translation_id': translation_id, 'status': 'written'})
+        fr.entries.append((_ST_WRITTEN, translation_id))
         self.total_written += 1
 
     def mark_skipped(self, file_path: str, reason: str, entry: Dict[str, Any] = None):
-        fr = self.files.get(file_path)
-        if not fr:
-            fr = FileReport(file_path=file_path)
-            self.files[file_path] = fr
+        fr = self._file_report(file_path)
         fr.skipped += 1
-        rec = {'status': 'skipped', 'reason': reason}
-        if entry:
-            rec.update(entry)
-        fr.entries.append(rec)
+        fr.entries.append((_ST_SKIPPED, reason, entry or None))
         self.total_skipped += 1
 
     def mark_unchanged(self, file_path: str, translation_id: str, original_text: str = None):
-        fr = self.files.get(file_path)
-        if not fr:
-            fr = FileReport(file_path=file_path)
-            self.files[file_path] = fr
+        fr = self._file_report(file_path)
         fr.unchanged += 1
-        rec = {'translation_id': translation_id, 'status': 'unchanged'}
-        if original_text is not None:
-            rec['original_text'] = original_text
-        fr.entries.append(rec)
+        fr.entries.append((_ST_UNCHANGED, translation_id, original_text))
         self.total_unchanged += 1
 
     def to_dict(self) -> Dict[str, Any]:
@@ -111,7 +122,7 @@ class DiagnosticReport:
                 'written': fr.written,
                 'skipped': fr.skipped,
                 'unchanged': fr.unchanged,
-                'entries': fr.entries,
+                'entries': [_entry_dict(e) for e in fr.entries],
             } for p, fr in self.files.items()}
         }
 
@@ -119,6 +130,14 @@ class DiagnosticReport:
         p = Path(path)
         try:
             p.parent.mkdir(parents=True, exist_ok=True)
-            p.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding='utf-8')
+            data = self.to_dict()
+            if ORJSON_AVAILABLE:
+                try:
+                    # Serialized in C straight to UTF-8 bytes
+                    p.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                    return
+                except orjson.JSONEncodeError:
+                    pass  # e.g. exotic entry values: let stdlib json try
+            p.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
         except Exception:
             pass
@@ -5,12 +5,17 @@ Output Formatter
 Formats translation results into Ren'Py translate block format.
 """
 
+import functools
 import logging
 import hashlib
+import os
+from datetime import datetime
 from typing import List, Dict, Set, TYPE_CHECKING, Optional
 from pathlib import Path
 import re
 
+from src.version import VERSION
+
 if TYPE_CHECKING:
     from src.core.translator import TranslationResult
 
@@ -24,6 +29,78 @@ def _preserve_case(src: str, dst: str) -> str:
     return dst
 
 
+def _glossary_fold(text: str) -> str:
+    """
+    Case-fold for the glossary pre-check. casefold() alone misses a few
+    pairs that re's IGNORECASE treats as equal (dotless ı / dotted İ vs i),
+    so those are folded to plain i as well.
+    """
+    return text.casefold().replace('\u0307', '').replace('\u0131', 'i')
+
+
+@functools.lru_cache(maxsize=64)
+def _glossary_terms(items: tuple):
+    """
+    Glossary terms ordered longest first (empty keys dropped), plus their
+    folded forms for the cheap "does the term occur at all" check.
+    Cached per glossary content.
+    """
+    sorted_terms = tuple(sorted((item for item in items if item[0]), key=lambda x: -len(x[0])))
+    return sorted_terms, tuple(_glossary_fold(src) for src, _ in sorted_terms)
+
+
+@functools.lru_cache(maxsize=64)
+def _glossary_exact(items: tuple) -> Dict[str, str]:
+    """
+    ``{src.lower(): dst}`` for apply_glossary's exact-match step. The first
+    key wins when several differ only in case. Cached per glossary content.
+    """
+    lookup: Dict[str, str] = {}
+    for src, dst in items:
+        lookup.setdefault(src.lower(), dst)
+    return lookup
+
+
+@functools.lru_cache(maxsize=1024)
+def _glossary_regex(sorted_terms: tuple):
+    """
+    Compile (already longest-first) glossary terms into one whole-word,
+    case-insensitive alternation.
+    
+    Each term is its own group, so ``targets[m.lastindex - 1]`` is the
+    replacement for a match. Cached per term subset: texts usually contain
+    the same few terms.
+    """
+    alternation = '|'.join('(' + re.escape(src) + ')' for src, _ in sorted_terms)
+    pattern = re.compile(r'(?i)\b(?:' + alternation + r')\b')
+    return pattern, tuple(dst for _, dst in sorted_terms)
+
+
+@functools.lru_cache(maxsize=65536)
+def _hash_id_cached(base: str) -> str:
+    """BLAKE2b based ID for make_hash_id; re-formatting the same entries reuses it."""
+    digest = hashlib.blake2b(base.encode("utf-8", errors="ignore"), digest_size=8).hexdigest()
+    return f"id_{digest}"
+
+
+# Files every Ren'Py game folder has (see _has_renpy_markers)
+_RENPY_MARKERS = frozenset(("options.rpy", "script.rpy", "gui.rpy"))
+
+
+def _has_renpy_markers(directory) -> bool:
+    """
+    True if the folder holds one of the _RENPY_MARKERS files.
+    One directory listing instead of an exists() call per marker file,
+    stopping at the first hit; normcase keeps Windows' case-insensitive
+    matching.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return any(os.path.normcase(entry.name) in _RENPY_MARKERS for entry in entries)
+    except OSError:
+        return False
+
+
 class RenPyOutputFormatter:
     def apply_glossary(self, text: str, glossary: dict, original_text: str = None) -> str:
         """
@@ -40,28 +117,28 @@ class RenPyOutputFormatter:
         # 1. Adım: Tam eşleşme kontrolü (En etkili yöntem)
         # Eğer orijinal metin sözlükteki bir anahtarla (büyük/küçük harf duyarsız) tam eşleşiyorsa
         # doğrudan sözlükteki karşılığını döndür.
+        # (tek bir sözlük araması; tablo sözlük içeriği başına önbelleklenir)
+        items = tuple(glossary.items())
         if original_text:
-            orig_stripped = original_text.strip()
-            for src, dst in glossary.items():
-                if src.lower() == orig_stripped.lower():
-                    return dst
+            dst = _glossary_exact(items).get(original_text.strip().lower())
+            if dst is not None:
+                return dst
 
         # 2. Adım: Metin içinde arama ve değiştirme
-        # En uzun terimler önce, çakışma riskini azaltır
-        sorted_terms = sorted(glossary.items(), key=lambda x: -len(x[0]))
-        result = text
-        for src, dst in sorted_terms:
-            # Sadece tam kelime eşleşmesi için word boundary kullan
-            pattern = re.compile(r'(?i)\b' + re.escape(src) + r'\b')
-            
-            # Eğer kaynak kelime çevrilmiş metinde HALA DURUYORSA (çevrilmemişse) değiştir
-            if pattern.search(result):
-                result = pattern.sub(lambda m: _preserve_case(m.group(0), dst), result)
-            
-            # TODO: Gelecekte makine çevirisinin yaptığı yaygın hataları da 
-            # (örn: Load -> Yük) burada yakalamak için eşleme tablosu eklenebilir.
-            
-        return result
+        # Önce metinde geçmeyen terimler ucuz bir alt dizi kontrolüyle elenir
+        # (_glossary_fold: regex'in (?i) eşleşmesini kaçırmaz); kalanlar tek bir
+        # regex'te (en uzun terim önce): metin bir kez taranır.
+        # Eğer kaynak kelime çevrilmiş metinde HALA DURUYORSA (çevrilmemişse) değiştir
+        terms, folded_terms = _glossary_terms(items)
+        folded_text = _glossary_fold(text)
+        present = tuple(term for term, folded in zip(terms, folded_terms) if folded in folded_text)
+        if not present:
+            return text
+        pattern, targets = _glossary_regex(present)
+        
+        # TODO: Gelecekte makine çevirisinin yaptığı yaygın hataları da 
+        # (örn: Load -> Yük) burada yakalamak için eşleme tablosu eklenebilir.
+        return pattern.sub(lambda m: _preserve_case(m.group(0), targets[m.lastindex - 1]), text)
     
     # File extensions that should never be translated
     SKIP_FILE_EXTENSIONS = (
@@ -75,7 +152,7 @@ class RenPyOutputFormatter:
     
     # Ren'Py technical terms that should never be translated
     # NOTE: Only lowercase terms here - Title Case like "History" are valid UI labels
-    RENPY_TECHNICAL_TERMS = {
+    RENPY_TECHNICAL_TERMS = frozenset({
         # Screen elements & style identifiers (always lowercase in code)
         'say', 'window', 'namebox', 'choice', 'quick', 'navigation',
         'return_button', 'page_label', 'page_label_text', 'slot',
@@ -99,7 +176,7 @@ class RenPyOutputFormatter:
         # Common technical single words
         'idle', 'hover', 'focus', 'insensitive', 'selected_idle',
         'selected_hover', 'selected_focus', 'selected_insensitive',
-    }
+    })
     
     # Pre-compiled regex patterns for performance (class-level caching)
     _FORMAT_PLACEHOLDER_RE = re.compile(r'\{[^}]*\}')
@@ -118,11 +195,66 @@ class RenPyOutputFormatter:
     _VERSION_RE = re.compile(r'^v?\d+\.\d+(\.\d+)?([a-z])?$')
     _FILE_PATH_SLASH_RE = re.compile(r'^[a-zA-Z0-9_/.\-]+$')
     _FILE_PATH_BACKSLASH_RE = re.compile(r'^[a-zA-Z0-9_\\\.\-]+$')
-    _ANGLE_PLACEHOLDER_RE = re.compile(r'[\u27e6\u27e7]')  # ⟦placeholder⟧ gibi
     _QMARK_PLACEHOLDER_RE = re.compile(r'\?[A-Za-z]\d{3}\?')  # ?V000? ?T000? vb.
+    # Whole-string "shape" checks of _should_skip_translation in one pattern,
+    # so a text is classified by a single match call instead of ten.
+    # URL and version were matched against the lowercased text.
+    _SKIP_SHAPE_RE = re.compile('|'.join([
+        f'(?i:{_URL_RE.pattern})',
+        _HEX_COLOR_RE.pattern,
+        _NUMBER_RE.pattern,
+        _FUNC_CALL_RE.pattern,
+        _MODULE_ATTR_RE.pattern,
+        _KEYVAL_RE.pattern,
+        _SNAKE_CASE_RE.pattern,
+        _SCREAMING_SNAKE_RE.pattern,
+        _GAME_SAVE_ID_RE.pattern,
+        f'(?i:{_VERSION_RE.pattern})',
+    ]))
+    _MEANINGFUL_TEXT_RE = re.compile(r'[a-zA-ZçğıöşüÇĞIİÖŞÜа-яА-Яа-яА-Я]{3,}')
+    _ID_INVALID_CHARS_RE = re.compile(r'[^a-zA-Z0-9_]')
+    _ID_UNDERSCORE_RUN_RE = re.compile(r'_+')
+    # bytes.translate delete table: drops everything but ASCII letters
+    _NON_LETTER_BYTES = bytes(b for b in range(256) if not (65 <= b <= 90 or 97 <= b <= 122))
+
+    # escape_renpy_string: protected Ren'Py syntax in group 1, otherwise a
+    # literal [[ / {{ (not opening a variable/tag) or a character to escape.
+    _RENPY_ESCAPE_RE = re.compile(
+        r'(\{#[^}]+\}|\[[^\[\]]+\]|\{[^{}]*\})'
+        r'|\[\[(?![^\[\]]+\])|\{\{(?![^{}]*\})'
+        r'|[\\"\r\n\t]'
+    )
+    # Any character escape_renpy_string would touch (or that opens a token)
+    _NEEDS_ESCAPE_RE = re.compile(r'[\\"\[{\r\n\t]')
+    # _escape_for_old_string: same idea, without [[ / {{ or \r / \t handling
+    _OLD_STRING_ESCAPE_RE = re.compile(r'(\[[^\[\]]+\]|\{[^{}]*\})|[\\"\n]')
+    _OLD_STRING_ESCAPES = {'\\': '\\\\', '"': '\\"', '\n': '\\n'}
+    # Without a [ or { there is nothing to protect, and the single-character
+    # escapes are done in one str.translate pass instead of the regex
+    _OLD_STRING_TABLE = str.maketrans(_OLD_STRING_ESCAPES)
+    # Keeps '# "..."' comment lines on one line
+    _COMMENT_TABLE = str.maketrans({'\n': '\\n', '\r': '\\r'})
+    _RENPY_ESCAPES = {
+        '[[': '\\\\[\\\\[',
+        '{{': '\\\\{\\\\{',
+        '\\': '\\\\',
+        '"': '\\"',
+        '\r': '',
+        '\n': '\\n',
+        '\t': '\\t',
+    }
+    # Same for escape_renpy_string ([[ / {{ only occur together with a [ / {)
+    _RENPY_ESCAPE_TABLE = str.maketrans({k: v for k, v in _RENPY_ESCAPES.items() if len(k) == 1})
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Output folders already created by save_translation_file
+        self._created_dirs: Set[str] = set()
+        # Resolved folder -> game directory, for this formatter only (found
+        # ones only). Besides every looked-up path, a successful walk also
+        # records the folders it passed on the way up, so lookups from
+        # sibling/parent output folders skip the walk.
+        self._game_dir_cache: Dict[str, Path] = {}
     
     def _should_skip_translation(self, text: str) -> bool:
         """
@@ -132,12 +264,24 @@ class RenPyOutputFormatter:
         Uses pre-compiled regex patterns for performance.
         """
         text_strip = text.strip()
-        text_lower = text_strip.lower()
         
         # Skip empty text
         if not text_strip:
             return True
         
+        # Skip Ren'Py technical terms - ONLY exact lowercase match
+        # "history" -> skip, "History" -> translate (UI label)
+        # (cheapest check first: a single frozenset lookup)
+        if text_strip in self.RENPY_TECHNICAL_TERMS:
+            return True
+        
+        has_space = ' ' in text_strip
+        # ASCII text without a single letter can't be a file name, a folder
+        # path or a config reference: one C-level pass over the bytes lets
+        # those checks be skipped for numbers, punctuation and the like.
+        has_letters = (not text_strip.isascii()
+                       or bool(text_strip.encode('ascii').translate(None, self._NON_LETTER_BYTES)))
+        
         # Skip Python format strings like {:,}, {:3d}, {}, {}Attitude:{} {}
         # These are used for number/string formatting and should not be translated
         if '{' in text_strip:
@@ -147,98 +291,65 @@ class RenPyOutputFormatter:
                 # Remove format placeholders and check remaining content
                 remaining = self._FORMAT_PLACEHOLDER_RE.sub('', text_strip).strip()
                 # If remaining has no meaningful letters, skip
-                if not re.search(r'[a-zA-ZçğıöşüÇĞIİÖŞÜа-яА-Яа-яА-Я]{3,}', remaining):
+                if not self._MEANINGFUL_TEXT_RE.search(remaining):
                     return True
                 # If format placeholders dominate the string, skip
                 if format_count >= 2 and len(remaining) < 10:
                     return True
         
-        # Skip file names/paths (fonts, images, audio, etc.)
-        if any(text_lower.endswith(ext) for ext in self.SKIP_FILE_EXTENSIONS):
-            return True
-        
-        # Skip paths starting with common folder names
-        if text_strip.startswith(('fonts/', 'images/', 'audio/', 'music/', 'sounds/', 
-                                   'gui/', 'screens/', 'script/', 'game/', 'tl/')):
-            return True
+        if has_letters:
+            # Skip file names/paths (fonts, images, audio, etc.)
+            # str.endswith takes the whole tuple: one C call, no generator
+            if text_strip.lower().endswith(self.SKIP_FILE_EXTENSIONS):
+                return True
+            
+            # Skip paths starting with common folder names
+            if text_strip.startswith(('fonts/', 'images/', 'audio/', 'music/', 'sounds/', 
+                                       'gui/', 'screens/', 'script/', 'game/', 'tl/')):
+                return True
         
         # Skip paths with slashes (file paths like "fonts/something.otf")
-        if '/' in text_strip and ' ' not in text_strip:
+        if not has_space and '/' in text_strip:
             if self._FILE_PATH_SLASH_RE.match(text_strip):
                 return True
         
         # Skip backslash paths (Windows style)
-        if '\\' in text_strip and ' ' not in text_strip:
+        if not has_space and '\\' in text_strip:
             if self._FILE_PATH_BACKSLASH_RE.match(text_strip):
                 return True
         
-        # Skip URLs (using cached pattern)
-        if self._URL_RE.match(text_lower):
-            return True
-        
-        # Skip hex color codes (using cached pattern)
-        if self._HEX_COLOR_RE.match(text_strip):
-            return True
-        
-        # Skip pure numbers (using cached pattern)
-        if self._NUMBER_RE.match(text_strip):
-            return True
-        
-        # Skip Ren'Py technical terms - ONLY exact lowercase match
-        # "history" -> skip, "History" -> translate (UI label)
-        if text_strip in self.RENPY_TECHNICAL_TERMS:
-            return True
-
-        # Skip likely function calls or code-like literals
-        if self._FUNC_CALL_RE.match(text_strip):
-            return True
-        # Skip module.attribute references
-        if self._MODULE_ATTR_RE.match(text_strip):
-            return True
-        # Skip key:value like config entries
-        if self._KEYVAL_RE.match(text_strip):
+        # Skip URLs, hex colors, numbers, function calls, module.attr,
+        # key:value, snake_case / SCREAMING_SNAKE identifiers, save IDs
+        # ("GameName-1234567890") and version strings - one combined pattern
+        if self._SKIP_SHAPE_RE.match(text_strip):
             return True
 
         # Skip angled placeholder markers like ⟦V000⟧
-        if self._ANGLE_PLACEHOLDER_RE.search(text_strip):
+        if '\u27e6' in text_strip or '\u27e7' in text_strip:
             return True
 
         # Skip question-mark placeholders like ?V000? ?T000?
-        if self._QMARK_PLACEHOLDER_RE.search(text_strip):
+        if '?' in text_strip and self._QMARK_PLACEHOLDER_RE.search(text_strip):
             return True
 
         # Skip obvious config/version placeholders that should remain untouched
-        if "config.version" in text_strip or "[config." in text_strip:
-            return True
-
-        # Skip snake_case identifiers (using cached pattern)
-        if self._SNAKE_CASE_RE.match(text_strip):
-            return True
-        
-        # Skip SCREAMING_SNAKE_CASE constants (using cached pattern)
-        if self._SCREAMING_SNAKE_RE.match(text_strip):
-            return True
-        
-        # Skip save identifiers like "GameName-1234567890" (using cached pattern)
-        if self._GAME_SAVE_ID_RE.match(text_strip):
-            return True
-        
-        # Skip version strings (using cached pattern)
-        if self._VERSION_RE.match(text_lower):
+        if has_letters and ("config.version" in text_strip or "[config." in text_strip):
             return True
         
         # Skip if it's just Ren'Py tags/variables with no actual text
-        stripped_of_tags = self._TAG_RE.sub('', text_strip)
-        stripped_of_vars = self._VARIABLE_RE.sub('', stripped_of_tags)
-        if not stripped_of_vars.strip():
-            return True
+        # (without a [ or { there is nothing to strip)
+        if '[' in text_strip or '{' in text_strip:
+            stripped_of_tags = self._TAG_RE.sub('', text_strip)
+            stripped_of_vars = self._VARIABLE_RE.sub('', stripped_of_tags)
+            if not stripped_of_vars.strip():
+                return True
         
         return False
     
     def sanitize_translation_id(self, text: str) -> str:
         """Create a valid Ren'Py translation ID from text (sanitized, short)."""
-        text = re.sub(r'[^a-zA-Z0-9_]', '_', text)
-        text = re.sub(r'_+', '_', text).strip('_')
+        text = self._ID_INVALID_CHARS_RE.sub('_', text)
+        text = self._ID_UNDERSCORE_RUN_RE.sub('_', text).strip('_')
         if text and text[0].isdigit():
             text = '_' + text
         return (text or 'translated_text')[:50]
@@ -247,8 +358,7 @@ class RenPyOutputFormatter:
                      file_path: str = "", line_number: int = 0) -> str:
         """Hash-based primary ID; context-aware to avoid collisions."""
         base = f"{file_path}:{line_number}:{'|'.join(context_path or [])}:{original_text}"
-        digest = hashlib.sha1(base.encode("utf-8", errors="ignore")).hexdigest()[:16]
-        return f"id_{digest}"
+        return _hash_id_cached(base)
     
     def escape_renpy_string(self, text: str) -> str:
         """Escape special characters for Ren'Py strings.
@@ -259,68 +369,24 @@ class RenPyOutputFormatter:
         - Protects disambiguation tags {#identifier}
         - Handles double brackets [[ and {{
         """
-        if not text:
+        # Fast path: most strings have nothing to escape or protect
+        if not text or not self._NEEDS_ESCAPE_RE.search(text):
             return text
-            
-        import re
-        
-        # Find all Ren'Py variables [variable] and expressions (including !t flag)
-        variable_pattern = re.compile(r'\[[^\[\]]+\]')
-        variables = variable_pattern.findall(text)
-        
-        # CRITICAL: Find disambiguation tags {#...} FIRST - these must be preserved exactly
-        disambiguation_pattern = re.compile(r'\{#[^}]+\}')
-        disambiguation_tags = disambiguation_pattern.findall(text)
-        
-        # Find all Ren'Py tags like {i}, {b}, {color=#ff0000}, {/i}, etc.
-        tag_pattern = re.compile(r'\{[^{}]*\}')
-        tags = tag_pattern.findall(text)
-        
-        # Replace variables and tags with placeholders temporarily
-        temp_text = text
-        protection_map = {}
-        counter = 0
-        
-        # Protect disambiguation tags FIRST (highest priority)
-        for dtag in disambiguation_tags:
-            placeholder = f"⟦DIS{counter:03d}⟧"
-            protection_map[placeholder] = dtag
-            temp_text = temp_text.replace(dtag, placeholder, 1)
-            counter += 1
-        
-        # Protect variables
-        for var in variables:
-            placeholder = f"⟦VAR{counter:03d}⟧"
-            protection_map[placeholder] = var
-            temp_text = temp_text.replace(var, placeholder, 1)
-            counter += 1
-        
-        # Protect tags (excluding disambiguation which are already protected)
-        for tag in tags:
-            if tag.startswith('{#'):  # Skip disambiguation tags
-                continue
-            placeholder = f"⟦TAG{counter:03d}⟧"
-            protection_map[placeholder] = tag
-            temp_text = temp_text.replace(tag, placeholder, 1)
-            counter += 1
-        
-        # Handle literal double brackets BEFORE escaping
-        # [[ should become \[\[ in Ren'Py to show literal [
-        temp_text = temp_text.replace('[[', '\\[\\[')
-        temp_text = temp_text.replace('{{', '\\{\\{')
-        
-        # Now escape the rest
-        temp_text = temp_text.replace('\\', '\\\\')  # Escape backslashes first
-        temp_text = temp_text.replace('"', '\\"')     # Escape double quotes
-        temp_text = temp_text.replace('\r', '')       # Remove carriage returns
-        temp_text = temp_text.replace('\n', '\\n')    # Escape newlines
-        temp_text = temp_text.replace('\t', '\\t')    # Escape tabs
-        
-        # Restore variables and tags
-        for placeholder, original_content in protection_map.items():
-            temp_text = temp_text.replace(placeholder, original_content)
-        
-        return temp_text
+        
+        return self._escape_cached(text)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _escape_cached(text: str) -> str:
+        # Memoized: UI strings ("Yes", "No", "Save", ...) repeat a lot and are
+        # escaped for both the original and the translation.
+        # One pass: disambiguation tags, variables and tags are copied as-is,
+        # everything else is escaped (see _RENPY_ESCAPES).
+        if '[' not in text and '{' not in text:
+            return text.translate(RenPyOutputFormatter._RENPY_ESCAPE_TABLE)
+        escapes = RenPyOutputFormatter._RENPY_ESCAPES
+        return RenPyOutputFormatter._RENPY_ESCAPE_RE.sub(
+            lambda m: m.group(1) or escapes[m.group(0)], text)
     
     def generate_translation_block(self, 
                                  original_text: str, 
@@ -329,14 +395,11 @@ class RenPyOutputFormatter:
                                  translation_id: str = None,
                                  context: str = None,
                                  mode: str = "simple") -> str:
-        """Generate a single translation block."""
+        """Generate a single translation block.
         
-        if not translation_id:
-            # Create string-based translation that matches any label
-            # This is more compatible with existing Ren'Py games
-            import hashlib
-            text_hash = hashlib.md5(original_text.encode('utf-8')).hexdigest()[:8]
-            translation_id = f"strings_{text_hash}"
+        Blocks are string-based (matched by text, not by label), so
+        translation_id is accepted for compatibility but not emitted.
+        """
         
         escaped_original = self.escape_renpy_string(original_text)
         escaped_translated = self.escape_renpy_string(translated_text)
@@ -349,7 +412,7 @@ class RenPyOutputFormatter:
             )
         else:
             # Simple format - original text in comment, direct translation line
-            comment_original = escaped_original.replace('\n', '\\n')
+            comment_original = escaped_original.translate(self._COMMENT_TABLE)
             block = (
                 f"    # \"{comment_original}\"\n"
                 f"    \"{escaped_translated}\"\n\n"
@@ -377,7 +440,7 @@ class RenPyOutputFormatter:
             )
         else:
             # Simple format - original text in comment, direct translation line
-            comment_original = escaped_original.replace('\n', '\\n')
+            comment_original = escaped_original.translate(self._COMMENT_TABLE)
             block = (
                 f"    # {character_name} \"{comment_original}\"\n"
                 f"    {character_name} \"{escaped_translated}\"\n\n"
@@ -399,23 +462,24 @@ class RenPyOutputFormatter:
         # Menu choices should be in translate strings block, not separate menu blocks
         # According to RenPy documentation: menu choices use "translate strings" format
         
-        block = f"# NOTE: Menu choices should be in 'translate {language_code} strings:' block\n"
-        block += f"# This is the old format and may not work properly in RenPy\n\n"
-        
         if not menu_id:
             menu_id = f"menu_{self.sanitize_translation_id('_'.join([opt['original'] for opt in menu_options[:3]]))}"
         
-        block += f"translate {language_code} {menu_id}:\n\n"
+        # Collect the pieces and join once instead of growing a string per choice
+        parts = [
+            f"# NOTE: Menu choices should be in 'translate {language_code} strings:' block\n"
+            f"# This is the old format and may not work properly in RenPy\n\n"
+            f"translate {language_code} {menu_id}:\n\n"
+        ]
         
-        for i, option in enumerate(menu_options):
+        for option in menu_options:
             original = self.escape_renpy_string(option['original'])
             translated = self.escape_renpy_string(option['translated'])
             # Add each choice with real newlines
-            block += f'    # "{original}"\n'
-            block += f'    "{translated}"\n'
+            parts.append(f'    # "{original}"\n    "{translated}"\n')
         
-        block += "\n"
-        return block
+        parts.append("\n")
+        return "".join(parts)
     
     def format_translation_file(self,
                               translation_results: List,
@@ -423,24 +487,42 @@ class RenPyOutputFormatter:
                               source_file: Path = None,
                               include_header: bool = True,
                               output_format: str = "old_new",
-                              glossary: dict = None) -> str:
-        """Format complete translation file with SEPARATE blocks for each translation."""
-        
-        output_lines = []
+                              glossary: dict = None,
+                              dedup: bool = True) -> str:
+        """Format complete translation file with SEPARATE blocks for each translation.
         
+        Pass dedup=False when the caller has already removed duplicates.
+        """
+        # Lines are produced lazily and joined once, instead of being collected
+        # in a per-block list and then copied into the file's line list.
+        return "\n".join(self._iter_translation_lines(
+            translation_results, language_code, source_file,
+            include_header, output_format, glossary, dedup))
+
+    def _iter_translation_lines(self,
+                                translation_results: List,
+                                language_code: str,
+                                source_file: Path,
+                                include_header: bool,
+                                output_format: str,
+                                glossary: dict,
+                                dedup: bool = True):
+        """Yield the lines of a translation file (see format_translation_file)."""
         if include_header:
-            header = self.generate_file_header(language_code, source_file)
-            output_lines.append(header)
+            yield self.generate_file_header(language_code, source_file)
         
         # CRITICAL FIX: Create ONE translate strings block for ALL translations
         # This is the CORRECT Ren'Py format
         
         seen_translations = set()
-        string_translations = []
+        # Paragraph escapes for this batch, keyed by text. (escape_renpy_string
+        # is memoized on its own; these two are not and their input is long.)
+        old_string_cache: Dict[str, str] = {}
+        p_function_cache: Dict[str, str] = {}
         
         # Add the opening translate strings block
-        string_translations.append(f"translate {language_code} strings:")
-        string_translations.append("")
+        yield f"translate {language_code} strings:"
+        yield ""
         
         for result in translation_results:
             if not result.success or not result.translated_text:
@@ -467,24 +549,22 @@ class RenPyOutputFormatter:
                 self.logger.debug(f"Skipping technical content: {original_text[:50]}...")
                 continue
 
-            # Avoid duplicates - use translation_id primarily, fallback to text pair
-            key = translation_id or f"{original_text}_{translated_text}"
-            if key in seen_translations:
-                continue
-            seen_translations.add(key)
+            # Avoid duplicates by translation_id (always set: make_hash_id above
+            # derives one from the text and its context when none is given)
+            if dedup:
+                if translation_id in seen_translations:
+                    continue
+                seen_translations.add(translation_id)
 
             text_type = getattr(result, 'text_type', None)
             
             # Add source file/line comment for translator reference (if available)
+            # (file_path/line_number were read from metadata above)
             source_info = ""
-            if hasattr(result, 'metadata') and result.metadata:
-                file_path = result.metadata.get('file_path', '')
-                line_number = result.metadata.get('line_number', '')
-                if file_path and line_number:
-                    # Extract just filename for cleaner output
-                    import os
-                    filename = os.path.basename(file_path)
-                    source_info = f"    # {filename}:{line_number}\n"
+            if file_path and line_number:
+                # Extract just filename for cleaner output (either separator)
+                filename = file_path.rsplit('/', 1)[-1].rsplit('\\', 1)[-1]
+                source_info = f"    # {filename}:{line_number}"
             
             # Check if this is a paragraph text (_p() function)
             is_paragraph = (
@@ -495,82 +575,41 @@ class RenPyOutputFormatter:
             
             if is_paragraph:
                 # Use _p() format for paragraph text
-                escaped_original = self._escape_for_old_string(original_text)
-                formatted_translated = self._format_p_function_output(translated_text)
-                
-                if output_format == "old_new":
-                    if source_info:
-                        string_translations.append(source_info.rstrip())
-                    string_translations.append(f"    # id: {translation_id}")
-                    string_translations.append(f'    old "{escaped_original}"')
-                    string_translations.append(f'    new {formatted_translated}')
-                    string_translations.append("")
-                else:
-                    # Simple format - just old/new without meta-comments
-                    string_translations.append(f'    old "{escaped_original}"')
-                    string_translations.append(f'    new {formatted_translated}')
-                    string_translations.append("")
+                escaped_original = old_string_cache.get(original_text)
+                if escaped_original is None:
+                    escaped_original = self._escape_for_old_string(original_text)
+                    old_string_cache[original_text] = escaped_original
+                new_value = p_function_cache.get(translated_text)
+                if new_value is None:
+                    new_value = self._format_p_function_output(translated_text)
+                    p_function_cache[translated_text] = new_value
             else:
                 # Standard string format
                 escaped_original = self.escape_renpy_string(original_text)
-                escaped_translated = self.escape_renpy_string(translated_text)
-                
-                if output_format == "old_new":
-                    if source_info:
-                        string_translations.append(source_info.rstrip())
-                    string_translations.append(f"    # id: {translation_id}")
-                    string_translations.append(f'    old "{escaped_original}"')
-                    string_translations.append(f'    new "{escaped_translated}"')
-                    string_translations.append("")
-                else:
-                    # Simple format - just old/new without meta-comments
-                    string_translations.append(f'    old "{escaped_original}"')
-                    string_translations.append(f'    new "{escaped_translated}"')
-                    string_translations.append("")
-        
-        # Combine header and strings
-        output_lines.extend(string_translations)
-        
-        # Join sections with real newlines
-        return "\n".join(output_lines)
+                new_value = f'"{self.escape_renpy_string(translated_text)}"'
+            
+            # One string per entry (its lines plus the blank separator line)
+            # rather than one yield per line
+            if output_format == "old_new":
+                meta = f"    # id: {translation_id}\n"
+                if source_info:
+                    meta = f"{source_info}\n{meta}"
+                yield f'{meta}    old "{escaped_original}"\n    new {new_value}\n'
+            else:
+                # Simple format - just old/new without meta-comments
+                yield f'    old "{escaped_original}"\n    new {new_value}\n'
     
     def _escape_for_old_string(self, text: str) -> str:
         """
         Escape text for use in 'old' string.
         Ren'Py expects paragraph breaks as literal \\n\\n in old strings.
         """
-        # Protect Ren'Py variables and tags first
-        variable_pattern = re.compile(r'\[[^\[\]]+\]')
-        tag_pattern = re.compile(r'\{[^{}]*\}')
-        
-        variables = variable_pattern.findall(text)
-        tags = tag_pattern.findall(text)
-        
-        temp_text = text
-        protection_map = {}
-        
-        for i, var in enumerate(variables):
-            placeholder = f"__VAR_{i}__"
-            protection_map[placeholder] = var
-            temp_text = temp_text.replace(var, placeholder, 1)
-        
-        for i, tag in enumerate(tags):
-            placeholder = f"__TAG_{i}__"
-            protection_map[placeholder] = tag
-            temp_text = temp_text.replace(tag, placeholder, 1)
-        
-        # Escape quotes and backslashes
-        temp_text = temp_text.replace('\\', '\\\\')
-        temp_text = temp_text.replace('"', '\\"')
-        
-        # Convert newlines to escaped form for old string
-        temp_text = temp_text.replace('\n', '\\n')
-        
-        # Restore protected content
-        for placeholder, original_content in protection_map.items():
-            temp_text = temp_text.replace(placeholder, original_content)
-        
-        return temp_text
+        # One pass: variables and tags are copied as-is; backslashes, quotes
+        # and newlines are escaped (paragraph breaks become literal \n\n)
+        if '[' not in text and '{' not in text:
+            return text.translate(self._OLD_STRING_TABLE)
+        escapes = self._OLD_STRING_ESCAPES
+        return self._OLD_STRING_ESCAPE_RE.sub(lambda m: m.group(1) or escapes[m.group(0)], text)
     
     def _format_p_function_output(self, text: str) -> str:
         """
@@ -583,70 +622,68 @@ class RenPyOutputFormatter:
             Second paragraph.
             \"\"\")
         """
-        # Split by paragraph breaks
-        paragraphs = text.split('\n\n')
-        
-        # Format with proper indentation for _p() 
-        lines = ['_p("""']
-        
-        for i, para in enumerate(paragraphs):
-            # Each paragraph on its own line with indentation
-            para_lines = para.split('\n')
-            for line in para_lines:
-                lines.append(f"    {line.strip()}")
-            
-            # Add blank line between paragraphs (except after last)
-            if i < len(paragraphs) - 1:
-                lines.append("")
-        
-        lines.append('    """)')
-        
-        return '\n'.join(lines)
+        # Each line indented for _p(); paragraphs (split on blank lines)
+        # stay separated by one empty line
+        body = '\n\n'.join(
+            '\n'.join(f"    {line.strip()}" for line in para.split('\n'))
+            for para in text.split('\n\n')
+        )
+        return f'_p("""\n{body}\n    """)'
     
     def generate_file_header(self, language_code: str, source_file: Path = None) -> str:
         """Generate file header with metadata."""
-        from datetime import datetime
-        from src.version import VERSION
-        
-        header = f"""# Ren'Py Translation File
+        head, tail = self._header_parts(language_code, str(source_file) if source_file else '')
+        return f"{head}{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{tail}"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _header_parts(language_code: str, source_file: str):
+        """Header text before and after the date, built once per language/source."""
+        head = f"""# Ren'Py Translation File
 # Language: {language_code}
 # Generated by: RenLocalizer v{VERSION}
-# Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
+# Date: """
+        tail = "\n"
         
         if source_file:
-            header += f"# Source file: {source_file}\\n"
+            tail += f"# Source file: {source_file}\\n"
         
-        header += """
+        tail += """
 # This file contains automatic translations.
 # Please review and edit as needed.
 
 """
-        return header
+        return head, tail
     
     def save_translation_file(self,
                             translation_results: List,
                             output_path: Path,
                             language_code: str,
                             source_file: Path = None,
-                            output_format: str = "simple") -> bool:
+                            output_format: str = "simple",
+                            dedup: bool = True) -> bool:
         """Save translations to file."""
         try:
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure output directory exists (once per folder for this formatter)
+            out_dir = str(output_path.parent)
+            if out_dir not in self._created_dirs:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(out_dir)
             
             # Generate content
             content = self.format_translation_file(
                 translation_results,
                 language_code,
                 source_file,
-                output_format=output_format
+                output_format=output_format,
+                dedup=dedup
             )
             
             # Write file with UTF-8 encoding (with BOM for Windows compatibility)
-            # Using utf-8-sig ensures Ren'Py correctly reads the file on all systems
-            with open(output_path, 'w', encoding='utf-8-sig', newline='\n') as f:
-                f.write(content)
+            # Using utf-8-sig ensures Ren'Py correctly reads the file on all systems.
+            # Content is fully built already: encode once and write the bytes
+            # directly rather than going through a text-mode file object.
+            output_path.write_bytes(content.encode('utf-8-sig'))
             
             self.logger.info(f"Saved translation file: {output_path}")
             return True
@@ -686,23 +723,28 @@ class RenPyOutputFormatter:
             lang_dir = output_base_dir / language_code
         
         lang_dir.mkdir(parents=True, exist_ok=True)
+        # save_translation_file below writes into it: no second mkdir there
+        self._created_dirs.add(str(lang_dir))
         
         # CRITICAL FIX: Create ONE translation file for all strings
         # This prevents duplicate string errors in Ren'Py
         
         # Global deduplication - remove EXACT duplicates only
         # NOTE: Case-sensitive! "Cafeteria" and "cafeteria" are DIFFERENT strings in Ren'Py
-        seen_strings = set()
-        unique_results = []
+        # First result per key wins; dicts keep insertion order, so the output
+        # order is the same on every run
+        unique_map = {}
+        keep_first = unique_map.setdefault  # one hash per key, no per-item attribute lookup
+        log_duplicates = self.logger.isEnabledFor(logging.DEBUG)
         
-        for result in translation_results:
-            # Case-sensitive key - Ren'Py treats "Cafeteria" and "cafeteria" as different strings
-            string_key = result.original_text.strip()
-            if string_key not in seen_strings:
-                seen_strings.add(string_key)
-                unique_results.append(result)
-            else:
-                self.logger.debug(f"Skipping duplicate string: {result.original_text[:50]}...")
+        # Case-sensitive key - Ren'Py treats "Cafeteria" and "cafeteria" as different strings
+        string_keys = [result.original_text.strip() for result in translation_results]
+        
+        for string_key, result in zip(string_keys, translation_results):
+            if keep_first(string_key, result) is not result and log_duplicates:
+                self.logger.debug("Skipping duplicate string: %s...", result.original_text[:50])
+        
+        unique_results = list(unique_map.values())
         
         # Create single master translation file
         # Use 'strings.rpy' for Ren'Py compatibility (same as _run_translate_command)
@@ -714,42 +756,95 @@ class RenPyOutputFormatter:
             output_path, 
             language_code, 
             None,  # No specific source file
-            output_format=output_format
+            output_format=output_format,
+            dedup=False  # unique_results is already deduplicated above
         ):
             output_files.append(output_path)
             self.logger.info(f"Created master translation file: {output_path} with {len(unique_results)} unique strings")
         
         return output_files
     
+    # Environment variables naming the project outright (skip the search):
+    # either the project folder (its game/ is used) or the game folder itself
+    GAME_DIR_ENV_VARS = ("REN_PY_PROJECT", "RENLOCALIZER_GAME_DIR")
+
     def _find_game_directory(self, base_path: Path) -> Path:
         """Find the game directory in a Ren'Py project."""
-        # Check current directory and parent directories for 'game' folder
-        current = Path(base_path).resolve()
-        
-        # Check if current path contains 'game' folder
-        if (current / "game").exists() and (current / "game").is_dir():
-            return current / "game"
+        for env_var in self.GAME_DIR_ENV_VARS:
+            override = os.environ.get(env_var)
+            if not override:
+                continue
+            game_dir = os.path.join(override, "game")
+            if os.path.isdir(game_dir):
+                return Path(game_dir)
+            if os.path.isdir(override):
+                return Path(override)
+        
+        key = os.path.realpath(os.fspath(base_path))
+        cache = self._game_dir_cache
+        game_dir = cache.get(key)
+        if game_dir is None:
+            game_dir, shortcuts = self._search_game_directory(key)
+            # Misses are not cached: the project may be unpacked (UnRen) or
+            # created later in the same session
+            if game_dir is not None:
+                cache[key] = game_dir
+                for folder in shortcuts:
+                    cache[folder] = game_dir
+        return game_dir
+
+    def invalidate_cache(self):
+        """Forget cached game directory lookups (e.g. after moving a project)."""
+        self._game_dir_cache.clear()
+
+    @staticmethod
+    def _search_game_directory(base_path: str):
+        """
+        Walk up from base_path looking for the game folder.
         
-        # Check parent directories
-        for parent in current.parents:
-            game_dir = parent / "game"
-            if game_dir.exists() and game_dir.is_dir():
-                # Verify it's a Ren'Py game directory by checking for common files
-                if any((game_dir / file).exists() for file in ["options.rpy", "script.rpy", "gui.rpy"]):
-                    return game_dir
+        Returns (game_dir or None, folders that resolve to the same answer):
+        a folder passed on the way up without a 'game' subfolder of its own
+        would repeat the rest of this walk, so it can share the result.
+        """
+        # Check current directory and parent directories for 'game' folder
+        # in one walk (plain strings and os.path: no Path objects per level).
+        # isdir() is False for missing or unreadable paths: one stat.
+        passed = []
+        folder = base_path
+        while True:
+            game_dir = os.path.join(folder, "game")
+            if os.path.isdir(game_dir):
+                # A 'game' folder right in base_path is taken as is; further
+                # up, verify it's a Ren'Py game directory by its common files
+                if folder == base_path or _has_renpy_markers(game_dir):
+                    return Path(game_dir), passed
+            else:
+                passed.append(folder)
+            parent = os.path.dirname(folder)
+            if parent == folder:
+                break
+            folder = parent
         
         # Check if current directory itself is the game directory
-        if any((current / file).exists() for file in ["options.rpy", "script.rpy", "gui.rpy"]):
-            return current
+        if _has_renpy_markers(base_path):
+            return Path(base_path), ()
         
-        return None
+        return None, ()
     
     def _create_language_init_file(self, game_dir: Path, language_code: str):
         """RenPy dökümantasyonuna tam uyumlu, sade başlatıcı dosya üretimi."""
         try:
-            init_file_path = game_dir / f"a0_{language_code}_language.rpy"
-            init_content = f'define config.language = "{language_code}"\n'
-            with open(init_file_path, 'w', encoding='utf-8-sig', newline='\n') as f:
+            init_file_path = os.path.join(os.fspath(game_dir), f"a0_{language_code}_language.rpy")
+            # UTF-8 with BOM, '\n' line ending; written as bytes (no text layer)
+            init_content = f'define config.language = "{language_code}"\n'.encode('utf-8-sig')
+            # Already there and unchanged: don't rewrite it (keeps its mtime)
+            try:
+                with open(init_file_path, 'rb') as f:
+                    if f.read() == init_content:
+                        return
+            except OSError:
+                pass
+            with open(init_file_path, 'wb') as f:
                 f.write(init_content)
             self.logger.info(f"Created minimal language file: {init_file_path}")
         except Exception as e:
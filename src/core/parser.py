@@ -17,6 +17,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import chardet
+from src.core.pyparse_grammar import extract_with_pyparsing
+from src.core.renpy_lexer import TokenStream
 from src.utils.encoding import read_text_safely
 import configparser
 import yaml
@@ -43,6 +45,146 @@ class ContextNode:
 
 
 class RenPyParser:
+    # Edge-case: Ignore lines with only technical terms or variable assignments
+    technical_line_re = re.compile(r'^(?:define|init|style|config|gui|store|layout)\b.*=\s*[^"\']+$')
+
+    # Edge-case: Ignore lines with only numbers, file paths, or color codes
+    numeric_or_path_re = re.compile(r'^(?:[0-9]+|[a-zA-Z0-9_/\\.-]+\.(?:png|jpg|ogg|mp3|rpy|rpyc)|#[0-9a-fA-F]{3,8})$')
+
+    # Edge-case: Ignore lines with only Ren'Py variables or tags
+    renpy_var_or_tag_re = re.compile(r'^(\{[^}]+\}|\[[^\]]+\])$')
+
+    # Edge-case: Ignore lines with only whitespace or comments
+    comment_or_empty_re = re.compile(r'^(\s*#.*|\s*)$')
+
+    # Edge-case: Menu/choice with technical condition (if, else, jump, call)
+    menu_technical_condition_re = re.compile(r'^\s*(?:if|else|jump|call)\b.*:')
+
+    # --- Core regex patterns (compiled once, shared by all instances) ---
+    # Common quoted-string pattern (handles optional prefixes like r, u, b, f)
+    _quoted_string = r'(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
+
+    char_dialog_re = re.compile(
+        r'^(?P<indent>\s*)(?P<char>[A-Za-z_]\w*)\s+'
+        r'(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
+    )
+    narrator_re = re.compile(
+        r'^(?P<indent>\s*)(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*(?:#.*)?$'
+    )
+
+    char_multiline_re = re.compile(
+        r'^(?P<indent>\s*)(?P<char>[A-Za-z_]\w*)\s+(?P<delim>"""|\'\'\')(?P<body>.*)$'
+    )
+    narrator_multiline_re = re.compile(
+        r'^(?P<indent>\s*)(?P<delim>"""|\'\'\')(?P<body>(?![\s]*\)).*)$'
+    )
+    extend_multiline_re = re.compile(
+        r'^(?P<indent>\s*)extend\s+(?P<delim>"""|\'\'\')(?P<body>(?![\s]*\)).*)$'
+    )
+
+    menu_choice_re = re.compile(
+        r'^\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*(?:if\s+[^:]+)?\s*:\s*'
+    )
+    menu_choice_multiline_re = re.compile(
+        r'^\s*(?P<delim>"""|\'\'\')(?P<body>(?![\s]*\)).*)\s*(?:if\s+[^:]+)?\s*:\s*$'
+    )
+    menu_title_re = re.compile(
+        r'^\s*menu\s*(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')?:'
+    )
+
+    screen_text_re = re.compile(
+        r'\s*(?:text|label|tooltip|vbar|slider|frame|window)\s+(?:_\s*\(\s*)?(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')(?:\s*\))?'
+    )
+    textbutton_re = re.compile(
+        r'^\s*textbutton\s+(?:_\s*\(\s*)?(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')(?:\s*\))?'
+    )
+    textbutton_translatable_re = re.compile(
+        r"^\s*textbutton\s+_\s*\(\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')\s*\)"
+    )
+    screen_text_translatable_re = re.compile(
+        r"^\s*(?:text|label|tooltip)\s+_\s*\(\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')\s*\)"
+    )
+    screen_multiline_re = re.compile(
+        r'^\s*(?:text|label|tooltip|textbutton)\s+(?:_\s*\(\s*)?(?P<delim>"""|\'\'\')(?P<body>.*)$'
+    )
+
+    config_string_re = re.compile(
+        r"^\s*config\.(?:name|version|about|menu_|window_title|save_name)\s*=\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')"
+    )
+    gui_text_re = re.compile(
+        r"^\s*gui\.(?:text|button|label|title|heading|caption|tooltip|confirm)(?:_[a-z_]*)?(?:\[[^\]]*\])?\s*=\s*(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')"
+    )
+    style_property_re = re.compile(
+        r"^\s*style\s*\.\s*[a-zA-Z_]\w*\s*=\s*(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')"
+    )
+
+    # Simplified patterns to avoid complex nested quoting issues
+    _p_single_re = re.compile(r'^\s*(?:define\s+)?(?:gui|config)\.[a-zA-Z_]\w*\s*=\s*_p\s*\(')
+    _p_multiline_re = re.compile(r'^\s*(?:define\s+)?(?:gui|config)\.[a-zA-Z_]\w*\s*=\s*_p\s*\(\s*"""')
+    _underscore_re = re.compile(r'^\s*(?:define\s+)?[a-zA-Z_]\w*\s*=\s*(?:Character\s*\()?_\s*\(')
+    define_string_re = re.compile(r'^\s*define\s+(?:gui|config)\.[a-zA-Z_]\w*\s*=\s*')
+
+    alt_text_re = re.compile(r'\balt\b')
+    input_text_re = re.compile(r'\b(default|prefix|suffix)\b')
+
+    gui_variable_re = re.compile(r'^\s*gui\.')
+
+    # Use the shared quoted-string pattern for these common cases to avoid
+    # duplicated complex literals and accidental unbalanced escapes.
+    renpy_show_re = re.compile(r'^\s*(?:\$\s+)?renpy\.show\s*\(\s*' + _quoted_string)
+
+    layout_text_re = re.compile(r'^\s*layout\.[a-zA-Z0-9_]+\s*=\s*' + _quoted_string)
+    store_text_re = re.compile(r'^\s*store\.[a-zA-Z0-9_]+\s*=\s*' + _quoted_string)
+    general_define_re = re.compile(r'^\s*define\s+[a-zA-Z0-9_.]+\s*=\s*' + _quoted_string)
+
+    menu_def_re = re.compile(r'^menu\s*(?:"([^\"]*)"|\'([^\']*)\')?:')
+    screen_def_re = re.compile(r'^screen\s+([A-Za-z_]\w*)')
+    python_block_re = re.compile(r'^(?:init(?:\s+[-+]?\d+)?\s+)?python\b.*:')
+    # Label definition (ensure present for tests)
+    label_def_re = re.compile(r'^label\s+([A-Za-z_][\w\.]*)\s*(?!hide):')
+
+    # ========== NEW PATTERNS FOR BETTER EXTRACTION (v2.4.1) ==========
+    # NVL narrator pattern - triple-quoted dialogues
+    nvl_narrator_re = re.compile(
+        r'^\s*nvl\s+clear\s+(?P<delim>"""|\'\'\')(?P<body>.*)$'
+    )
+    
+    # Default translatable variables: default myvar = _("text")
+    default_translatable_re = re.compile(
+        r'^\s*default\s+[a-zA-Z_]\w*\s*=\s*_\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*\)'
+    )
+    
+    # Show screen with string parameters
+    show_screen_re = re.compile(
+        r'^\s*show\s+screen\s+[a-zA-Z_]\w*\s*\((?:[^,)]*,\s*)*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
+    )
+    
+    # Translate block detection (to skip already translated content)
+    translate_block_re = re.compile(
+        r'^\s*translate\s+([a-zA-Z_]\w*)\s+([a-zA-Z_]\w*)\s*:'
+    )
+
+    # deep_scan_strings / _extract_python_blocks_for_ast patterns
+    # Python block start, anywhere in the file content (re.MULTILINE)
+    _python_block_start_re = re.compile(r'^(\s*)(?:init\s+(?:[-+]?\d+\s+)?)?python\s*(?:\w+)?:', re.MULTILINE)
+    # All single-line string literals, with optional prefixes (r, u, b, f, fr, rf, etc.)
+    _string_literal_re = re.compile(
+        r'''(?P<quote>(?:[rRuUbBfF]{,2})?(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'))'''
+    )
+    # Triple-quoted strings with optional prefixes (searched over the whole file)
+    _triple_quote_re = re.compile(
+        r'''(?P<triple>(?:[rRuUbBfF]{,2})?(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'))'''
+    )
+    # Key-value context ("key": / key =) right before a string
+    _key_capture_re = re.compile(r'(?:["\']?(\w+)["\']?\s*[:=]\s*)$')
+    # Assignment detection (var = value)
+    _assignment_context_re = re.compile(r'([a-zA-Z_]\w*)\s*=\s*')
+    # join call detection ("delimiter".join([...]) )
+    _join_call_re = re.compile(r'(?P<delim>"[^"]*"|\'[^\']*\')\s*\.\s*join\s*\(')
+    _list_context_re = re.compile(r'([a-zA-Z_]\w*)\s*(?:=\s*[\[\(\{]|\+=\s*[\[\(]|\.(?:append|extend|insert)\s*\()')
+
+    # ========== END NEW PATTERNS ==========
+
     def __init__(self, config_manager=None):
         self.logger = logging.getLogger(__name__)
         self.config = config_manager
@@ -72,147 +214,14 @@ class RenPyParser:
             'layout', 'store', 'style', 'action', 'caption', 'title', 'textbutton', 'label', 'tooltip'
         }
 
-        # Edge-case: Ignore lines with only technical terms or variable assignments
-        self.technical_line_re = re.compile(r'^(?:define|init|style|config|gui|store|layout)\b.*=\s*[^"\']+$')
-
-        # Edge-case: Ignore lines with only numbers, file paths, or color codes
-        self.numeric_or_path_re = re.compile(r'^(?:[0-9]+|[a-zA-Z0-9_/\\.-]+\.(?:png|jpg|ogg|mp3|rpy|rpyc)|#[0-9a-fA-F]{3,8})$')
-
-        # Edge-case: Ignore lines with only Ren'Py variables or tags
-        self.renpy_var_or_tag_re = re.compile(r'^(\{[^}]+\}|\[[^\]]+\])$')
-
-        # Edge-case: Ignore lines with only whitespace or comments
-        self.comment_or_empty_re = re.compile(r'^(\s*#.*|\s*)$')
-
-        # Edge-case: Menu/choice with technical condition (if, else, jump, call)
-        self.menu_technical_condition_re = re.compile(r'^\s*(?:if|else|jump|call)\b.*:')
-
         # Edge-case: AST node type filtering (for future AST integration)
         self.ast_technical_types = {
             'Store', 'Config', 'Style', 'Layout', 'ImageButton', 'Hotspot', 'Hotbar', 'Slider', 'Viewport', 'ScrollBar', 'Action', 'Confirm', 'Notify', 'Input', 'Frame', 'Window', 'Vbox', 'Hbox', 'Side', 'Caption', 'Title', 'Label', 'Tooltip', 'TextButton'
         }
-        # --- Core regex patterns and registries (ensure attributes exist for tests) ---
-        # Common quoted-string pattern (handles optional prefixes like r, u, b, f)
-        self._quoted_string = r'(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
-
-        self.char_dialog_re = re.compile(
-            r'^(?P<indent>\s*)(?P<char>[A-Za-z_]\w*)\s+'
-            r'(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
-        )
-        self.narrator_re = re.compile(
-            r'^(?P<indent>\s*)(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*(?:#.*)?$'
-        )
-
-        self.char_multiline_re = re.compile(
-            r'^(?P<indent>\s*)(?P<char>[A-Za-z_]\w*)\s+(?P<delim>"""|\'\'\')(?P<body>.*)$'
-        )
-        self.narrator_multiline_re = re.compile(
-            r'^(?P<indent>\s*)(?P<delim>"""|\'\'\')(?P<body>(?![\s]*\)).*)$'
-        )
-        self.extend_multiline_re = re.compile(
-            r'^(?P<indent>\s*)extend\s+(?P<delim>"""|\'\'\')(?P<body>(?![\s]*\)).*)$'
-        )
-
-        self.menu_choice_re = re.compile(
-            r'^\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*(?:if\s+[^:]+)?\s*:\s*'
-        )
-        self.menu_choice_multiline_re = re.compile(
-            r'^\s*(?P<delim>"""|\'\'\')(?P<body>(?![\s]*\)).*)\s*(?:if\s+[^:]+)?\s*:\s*$'
-        )
-        self.menu_title_re = re.compile(
-            r'^\s*menu\s*(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')?:'
-        )
-
-        self.screen_text_re = re.compile(
-            r'\s*(?:text|label|tooltip|vbar|slider|frame|window)\s+(?:_\s*\(\s*)?(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')(?:\s*\))?'
-        )
-        self.textbutton_re = re.compile(
-            r'^\s*textbutton\s+(?:_\s*\(\s*)?(?:[rRuUbBfF]{,2})?(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')(?:\s*\))?'
-        )
-        self.textbutton_translatable_re = re.compile(
-            r"^\s*textbutton\s+_\s*\(\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')\s*\)"
-        )
-        self.screen_text_translatable_re = re.compile(
-            r"^\s*(?:text|label|tooltip)\s+_\s*\(\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')\s*\)"
-        )
-        self.screen_multiline_re = re.compile(
-            r'^\s*(?:text|label|tooltip|textbutton)\s+(?:_\s*\(\s*)?(?P<delim>"""|\'\'\')(?P<body>.*)$'
-        )
-
-        self.config_string_re = re.compile(
-            r"^\s*config\.(?:name|version|about|menu_|window_title|save_name)\s*=\s*(?:[rRuUbBfF]{,2})?(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')"
-        )
-        self.gui_text_re = re.compile(
-            r"^\s*gui\.(?:text|button|label|title|heading|caption|tooltip|confirm)(?:_[a-z_]*)?(?:\[[^\]]*\])?\s*=\s*(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')"
-        )
-        self.style_property_re = re.compile(
-            r"^\s*style\s*\.\s*[a-zA-Z_]\w*\s*=\s*(?P<quote>\"(?:[^\"\\]|\\.)*\"|'(?:[^\\']|\\.)*')"
-        )
-
-        # Simplified patterns to avoid complex nested quoting issues
-        self._p_single_re = re.compile(r'^\s*(?:define\s+)?(?:gui|config)\.[a-zA-Z_]\w*\s*=\s*_p\s*\(')
-        self._p_multiline_re = re.compile(r'^\s*(?:define\s+)?(?:gui|config)\.[a-zA-Z_]\w*\s*=\s*_p\s*\(\s*"""')
-        self._underscore_re = re.compile(r'^\s*(?:define\s+)?[a-zA-Z_]\w*\s*=\s*(?:Character\s*\()?_\s*\(')
-        self.define_string_re = re.compile(r'^\s*define\s+(?:gui|config)\.[a-zA-Z_]\w*\s*=\s*')
-
-        self.alt_text_re = re.compile(r'\balt\b')
-        self.input_text_re = re.compile(r'\b(default|prefix|suffix)\b')
-
-        self.gui_variable_re = re.compile(r'^\s*gui\.')
-
-        # Use the shared quoted-string pattern for these common cases to avoid
-        # duplicated complex literals and accidental unbalanced escapes.
-        self.renpy_show_re = re.compile(r'^\s*(?:\$\s+)?renpy\.show\s*\(\s*' + self._quoted_string)
-
-        self.layout_text_re = re.compile(r'^\s*layout\.[a-zA-Z0-9_]+\s*=\s*' + self._quoted_string)
-        self.store_text_re = re.compile(r'^\s*store\.[a-zA-Z0-9_]+\s*=\s*' + self._quoted_string)
-        self.general_define_re = re.compile(r'^\s*define\s+[a-zA-Z0-9_.]+\s*=\s*' + self._quoted_string)
 
         # pattern registry placeholder (populated later in code)
         self.pattern_registry = []
         self.multiline_registry = []
-        self.menu_def_re = re.compile(r'^menu\s*(?:"([^\"]*)"|\'([^\']*)\')?:')
-        self.screen_def_re = re.compile(r'^screen\s+([A-Za-z_]\w*)')
-        self.python_block_re = re.compile(r'^(?:init(?:\s+[-+]?\d+)?\s+)?python\b.*:')
-        # Label definition (ensure present for tests)
-        self.label_def_re = re.compile(r'^label\s+([A-Za-z_][\w\.]*)\s*(?!hide):')
-        # -------------------------------------------------------------------------
-        
-        # Initialize v2.4.1 patterns
-        self._init_new_patterns()
-        
-    # ========== NEW PATTERNS FOR BETTER EXTRACTION (v2.4.1) ==========
-    # These are initialized in __init__ but need class-level declarations
-    nvl_narrator_re = None
-    default_translatable_re = None
-    show_screen_re = None
-    translate_block_re = None
-
-    def _init_new_patterns(self):
-        """Initialize v2.4.1 patterns (called from __init__)."""
-        import re
-        
-        # NVL narrator pattern - triple-quoted dialogues
-        self.nvl_narrator_re = re.compile(
-            r'^\s*nvl\s+clear\s+(?P<delim>"""|\'\'\')(?P<body>.*)$'
-        )
-        
-        # Default translatable variables: default myvar = _("text")
-        self.default_translatable_re = re.compile(
-            r'^\s*default\s+[a-zA-Z_]\w*\s*=\s*_\s*\(\s*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')\s*\)'
-        )
-        
-        # Show screen with string parameters
-        self.show_screen_re = re.compile(
-            r'^\s*show\s+screen\s+[a-zA-Z_]\w*\s*\((?:[^,)]*,\s*)*(?P<quote>"(?:[^"\\]|\\.)*"|\'(?:[^\\\']|\\.)*\')'
-        )
-        
-        # Translate block detection (to skip already translated content)
-        self.translate_block_re = re.compile(
-            r'^\s*translate\s+([a-zA-Z_]\w*)\s+([a-zA-Z_]\w*)\s*:'
-        )
-
-    # ========== END NEW PATTERNS ==========
 
     def _register_patterns(self):
         self.pattern_registry = [
@@ -315,7 +324,6 @@ class RenPyParser:
                     # Additional sanity: remove placeholders/tags and require at least
                     # two letters to be considered translatable; attach a raw_text
                     # field (escaped and quoted) for deterministic ID generation.
-                    import re
                     cleaned = re.sub(r'(\[[^\]]+\]|\{[^}]+\})', '', cell or '').strip()
                     # Language-independent: require at least two Unicode letters
                     if sum(1 for ch in cleaned if ch.isalpha()) < 2:
@@ -341,7 +349,6 @@ class RenPyParser:
             for idx, line in enumerate(lines):
                 line = line.strip()
                 # Tighten TXT filters: require two Unicode letters after removing placeholders/tags
-                import re
                 cleaned = re.sub(r'(\[[^\]]+\]|\{[^}]+\})', '', line or '').strip()
                 if sum(1 for ch in cleaned if ch.isalpha()) < 2:
                     continue
@@ -384,7 +391,6 @@ class RenPyParser:
 
         # 1. Pyparsing grammar ile ana extraction (tüm dosya)
         try:
-            from src.core.pyparse_grammar import extract_with_pyparsing
             py_entries = extract_with_pyparsing(content, file_path=str(file_path))
             for entry in py_entries:
                 ctx = entry.get('context_path') or []
@@ -415,7 +421,6 @@ class RenPyParser:
 
         # 1b. Lightweight lexer-based extraction (TokenStream iterator)
         try:
-            from src.core.renpy_lexer import TokenStream
             stream = TokenStream(content, file_path=str(file_path))
             for token in stream:
                 if token.type not in ("STRING", "TRIPLE_STRING"):
@@ -450,6 +455,11 @@ class RenPyParser:
             self.logger.debug(f"TokenStream extraction unavailable or failed: {e}")
 
         # 2. Regex ile context-aware extraction (UI, screen, python _() fonksiyonları)
+        # Kayıtlı desen yoksa bu geçiş yalnızca context takibi yapar ve hiçbir
+        # entry üretmez: satırları hiç dolaşma.
+        pattern_registry = self.pattern_registry
+        if not pattern_registry:
+            return entries
         current_context = []
         for idx, raw_line in enumerate(lines):
             stripped_line = raw_line.strip()
@@ -473,7 +483,11 @@ class RenPyParser:
                 current_context.pop()
             if not stripped_line or stripped_line.startswith('#'):
                 continue
-            for descriptor in self.pattern_registry:
+            # Desenler yalnızca tırnaklı bir grup üzerinden entry üretir:
+            # tırnak içermeyen satırda (label, jump, kod...) regex denemeye gerek yok
+            if '"' not in raw_line and "'" not in raw_line:
+                continue
+            for descriptor in pattern_registry:
                 match = descriptor['regex'].match(raw_line)
                 if not match:
                     continue
@@ -533,7 +547,6 @@ class RenPyParser:
             def recurse(obj, path, current_key):
                 if isinstance(obj, str):
                     # Tighten JSON filters and include raw_text for ID stability
-                    import re
                     cleaned = re.sub(r'(\[[^\]]+\]|\{[^}]+\})', '', obj or '').strip()
                     if sum(1 for ch in cleaned if ch.isalpha()) < 2:
                         return
@@ -1051,7 +1064,6 @@ class RenPyParser:
     def _extract_string_content(self, quoted_string: str) -> str:
         if not quoted_string:
             return ''
-        import re
         # Match optional prefixes (r, u, b, f, fr, rf, etc.) and quoted content
         m = re.match(r"^(?P<prefix>[rRuUbBfF]{,2})?(?P<quoted>\"\"\"[\s\S]*?\"\"\"|\'\'\'[\s\S]*?\'\'\'|\"(?:[^\"\\]|\\.)*\"|\'(?:[^'\\]|\\.)*\')$", quoted_string, flags=re.S)
         if m:
@@ -1595,7 +1607,6 @@ class RenPyParser:
                         restored_text = restored_text.replace(pattern, original_placeholder)
                 
                 # Regex fallback for Unicode markers with potential corruption
-                import re
                 unicode_patterns = [
                     r'⟦\s*' + re.escape(number_part) + r'\s*⟧',  # Flexible whitespace
                     r'\[\s*' + re.escape(number_part) + r'\s*\]',  # Similar brackets
@@ -1748,7 +1759,7 @@ class RenPyParser:
         blocks: List[Tuple[int, str]] = []
         
         # init python ve python bloklarını bul
-        python_block_re = re.compile(r'^(\s*)(?:init\s+(?:[-+]?\d+\s+)?)?python\s*(?:\w+)?:', re.MULTILINE)
+        python_block_re = self._python_block_start_re
         
         in_block = False
         block_start = 0
@@ -1833,22 +1844,20 @@ class RenPyParser:
         # Tüm string literal'leri yakalayan regex
         # Hem tek tırnak hem çift tırnak, escape karakterlerle
         # Support optional string prefixes (r, u, b, f, fr, rf, etc.)
-        string_literal_re = re.compile(
-            r'''(?P<quote>(?:[rRuUbBfF]{,2})?(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'))'''
-        )
+        string_literal_re = self._string_literal_re
 
         # Triple-quoted stringler için ayrı regex (çok satırlı - tüm dosyada ara)
         # Triple-quoted strings with optional prefixes
-        triple_quote_re = re.compile(
-            r'''(?P<triple>(?:[rRuUbBfF]{,2})?(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'))'''
-        )
+        triple_quote_re = self._triple_quote_re
 
         # Key-value eşleştirmesi için regex
-        key_capture_re = re.compile(r'(?:["\']?(\w+)["\']?\s*[:=]\s*)$')
+        key_capture_re = self._key_capture_re
         # Assignment detection (var = value)
-        assignment_context_re = re.compile(r'([a-zA-Z_]\w*)\s*=\s*')
+        assignment_context_re = self._assignment_context_re
         # join call detection ("delimiter".join([...]) )
-        join_call_re = re.compile(r'(?P<delim>"[^"]*"|\'[^\']*\')\s*\.\s*join\s*\(')
+        join_call_re = self._join_call_re
+        # List/tuple/dict context (var = [..., var += [..., var.append(...)
+        list_context_re = self._list_context_re
 
         # Önce çok satırlı triple-quoted stringleri tüm dosyada ara
         # Bu sayede birden fazla satıra yayılan stringler de yakalanır
@@ -1928,7 +1937,6 @@ class RenPyParser:
                 context_tag = 'deep_scan'
                 # 1. Try finding context in the current line
                 found_key = None
-                list_context_re = re.compile(r'([a-zA-Z_]\w*)\s*(?:=\s*[\[\(\{]|\+=\s*[\[\(]|\.(?:append|extend|insert)\s*\()')
                 list_match = list_context_re.search(line[:match.start()])
 
                 # 2. Look back at previous lines if not found
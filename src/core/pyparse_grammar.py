@@ -7,24 +7,23 @@ Goals:
 - Menu/screen/python/_() coverage with placeholder preservation
 - Logical line joining (line continuation with backslash)
 """
+import re
 from typing import List, Dict
 
+try:  # Optional perf boost if pyparsing yüklü (configured once, at import)
+    from pyparsing import ParserElement
+
+    ParserElement.setDefaultWhitespaceChars(" \t")
+    ParserElement.enablePackrat()
+except Exception:
+    pass
+
 
 def extract_with_pyparsing(content: str, file_path: str = "") -> List[Dict]:
     """
     "Pyparsing" adı kalsa da, burada indentation tabanlı bir state machine var.
     Ren'Py SDK yüklenmeden diyalog/menü/screen/_() metinlerini çıkarır.
     """
-    try:  # Optional perf boost if pyparsing yüklü
-        from pyparsing import ParserElement
-
-        ParserElement.setDefaultWhitespaceChars(" \t")
-        ParserElement.enablePackrat()
-    except Exception:
-        pass
-
-    import re
-
     entries: List[Dict] = []
 
     TECHNICAL_PREFIXES = (
@@ -1191,7 +1191,6 @@ class ASTTextExtractor:
     
     def _is_technical_string(self, text: str, context: str = "") -> bool:
         """Check if string is technical (not translatable)."""
-        import re
         p = self.parser
 
         text_strip = text.strip()
@@ -1240,7 +1239,6 @@ class ASTTextExtractor:
         """
         if not quoted_string:
             return ''
-        import re
         m = re.match(r"^(?P<prefix>[rRuUbBfF]{,2})?(?P<quoted>\"\"\"[\s\S]*?\"\"\"|\'\'\'[\s\S]*?\'\'\'|\"(?:[^\"\\]|\\.)*\"|\'(?:[^'\\]|\\.)*\')$", quoted_string, flags=re.S)
         if m:
             content_raw = m.group('quoted')
@@ -1580,7 +1578,6 @@ class ASTTextExtractor:
     
     def _extract_strings_from_code(self, code: str, line_number: int) -> None:
         """Extract string literals from Python code with enhanced pattern matching."""
-        import re
         p = self.parser
         # Try AST-based parsing first — this is more robust for Python code
         try:
@@ -1880,7 +1877,6 @@ class ASTTextExtractor:
 
     def _extract_strings_from_line(self, line: str, line_number: int) -> None:
         """Extract string literals from a line of code."""
-        import re
 
         # First check for common translatable patterns
         self._extract_strings_from_code(line, line_number)
@@ -19,6 +19,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from src.utils.encoding import read_text_safely
+from src.core.tl_parser_cache import load_or_parse
 
 
 @dataclass
@@ -425,13 +426,14 @@ class TLParser:
         
         return text
     
-    def parse_directory(self, tl_dir: str, language: str) -> List[TranslationFile]:
+    def parse_directory(self, tl_dir: str, language: str, use_cache: bool = False) -> List[TranslationFile]:
         """
         tl/<dil>/ klasöründeki tüm .rpy dosyalarını parse eder.
         
         Args:
             tl_dir: tl klasörü yolu (game/tl)
             language: Dil kodu (turkish, spanish, vs.)
+            use_cache: Değişmemiş dosyalar için disk önbelleğini kullan
             
         Returns:
             TranslationFile listesi
@@ -460,7 +462,10 @@ class TLParser:
             for filename in filenames:
                 if filename.endswith('.rpy'):
                     file_path = os.path.join(root, filename)
-                    tl_file = self.parse_file(file_path)
+                    if use_cache:
+                        tl_file = load_or_parse(self, file_path)
+                    else:
+                        tl_file = self.parse_file(file_path)
                     if tl_file:
                         files.append(tl_file)
         
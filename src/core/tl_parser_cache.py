@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk cache for parsed translation files.
+
+Re-running tools over the same tl/ folders (e.g. ``fuzzy`` while tuning
+``--threshold``) reparses every file. Parsed results are pickled per file
+and reused while the file's size and mtime are unchanged. The folder is
+pruned of unused entries the first time a process writes to it.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Bump when TranslationFile / TranslationEntry or the parser output changes
+CACHE_VERSION = 1
+
+# Entries not used for this long are dropped, and the folder is capped at
+# this many entries (least recently used go first)
+CACHE_MAX_AGE_DAYS = 30
+CACHE_MAX_ENTRIES = 5000
+
+# Cache folders already pruned by this process
+_pruned_dirs: Set[Path] = set()
+
+
+def get_cache_dir() -> Path:
+    """Return the folder where parsed TL files are cached."""
+    if os.name == "nt":
+        base = Path(os.getenv("LOCALAPPDATA", Path.home()))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "RenLocalizer" / "tlparse"
+
+
+def _cache_path(file_path: str) -> Path:
+    key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    return get_cache_dir() / f"{key}.pkl"
+
+
+def load_or_parse(parser, file_path: str):
+    """
+    Return ``parser.parse_file(file_path)``, served from the cache when the
+    file has not changed since it was last parsed.
+
+    Cache problems are never fatal: any read/write error falls back to
+    parsing (and simply not caching).
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return parser.parse_file(file_path)
+
+    stamp = (CACHE_VERSION, file_path, st.st_mtime_ns, st.st_size)
+    cache_file = _cache_path(file_path)
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_stamp, tl_file = pickle.load(f)
+        if cached_stamp == stamp:
+            # Mark the entry as recently used so pruning keeps it
+            try:
+                os.utime(cache_file)
+            except OSError:
+                pass
+            return tl_file
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"TL parse cache unreadable for {file_path}: {e}")
+
+    tl_file = parser.parse_file(file_path)
+    _store(cache_file, stamp, tl_file)
+    return tl_file
+
+
+def _store(cache_file: Path, stamp: tuple, tl_file: Optional[object]) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        if cache_file.parent not in _pruned_dirs:
+            _pruned_dirs.add(cache_file.parent)
+            _prune(cache_file.parent)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump((stamp, tl_file), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.debug(f"TL parse cache not written for {cache_file.name}: {e}")
+
+
+def _prune(cache_dir: Path) -> None:
+    """Drop stale entries (and leftover temp files) from ``cache_dir``."""
+    cutoff = time.time() - CACHE_MAX_AGE_DAYS * 86400
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith((".pkl", ".tmp")):
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if mtime < cutoff:
+                _remove(entry.path)
+            elif entry.name.endswith(".pkl"):
+                entries.append((mtime, entry.path))
+
+    if len(entries) > CACHE_MAX_ENTRIES:
+        entries.sort()
+        for _, path in entries[:len(entries) - CACHE_MAX_ENTRIES]:
+            _remove(path)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -11,6 +11,7 @@ Bu modül tüm çeviri sürecini entegre bir pipeline olarak yönetir.
 import os
 import logging
 import asyncio
+import functools
 import re
 from typing import Optional, List, Dict, Callable, Tuple
 from dataclasses import dataclass
@@ -64,6 +65,12 @@ def _get_renpy_to_api_lang():
 RENPY_TO_API_LANG = _get_renpy_to_api_lang()
 
 
+@functools.lru_cache(maxsize=8192)
+def _glossary_term_pattern(term: str) -> "re.Pattern":
+    """Whole-word, case-insensitive pattern for a glossary term (escaped/compiled once)."""
+    return re.compile(r'(?i)\b' + re.escape(term) + r'\b')
+
+
 class PipelineStage(Enum):
     """Pipeline aşamaları"""
     IDLE = "idle"
@@ -1632,7 +1639,7 @@ class TranslationPipeline(QObject):
             if not src or not dst: continue
             
             # Sadece tam kelime eşleşmesi (\b)
-            pattern = re.compile(r'(?i)\b' + re.escape(src) + r'\b')
+            pattern = _glossary_term_pattern(src)
             
             def replace_func(match):
                 nonlocal counter
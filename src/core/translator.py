@@ -27,6 +27,16 @@ RENPY_ESCAPED_PATTERN = re.compile(r'\{\{|\}\}')
 RENPY_QMARK_PLACEHOLDER_RE = re.compile(r'\?[A-Za-z]\d{3}\?')
 # ⟦V000⟧ gibi açılı parantez placeholder'lar
 RENPY_ANGLE_PLACEHOLDER_RE = re.compile(r'\u27e6[^\u27e7]+\u27e7')
+# protect_renpy_syntax tek geçiş deseni
+# Match order: escaped braces '{{' or '}}', full tags '{...}', square vars '[...]',
+# Ren'Py qmark placeholders (?V000?, ?T000?) and angled placeholders (⟦V000⟧)
+RENPY_PROTECT_RE = re.compile(
+    r'(\{\{|\}\}|\{[^\}]+\}|\[[^\[\]]+\]|'
+    r'\?[A-Za-z]\d{3}\?|'
+    r'\u27e6[^\u27e7]+\u27e7)'
+)
+# XRPYX...XRPYX placeholder'larına göre bölme (PseudoTranslator)
+PLACEHOLDER_SPLIT_RE = re.compile(r'(XRPYX[A-Z0-9]+XRPYX)')
 
 
 def protect_renpy_syntax(text: str) -> Tuple[str, Dict[str, str]]:
@@ -37,17 +47,9 @@ def protect_renpy_syntax(text: str) -> Tuple[str, Dict[str, str]]:
     # Single-pass scanning to avoid nested replacement collisions.
     placeholders: Dict[str, str] = {}
     counter = 0
-
-    # Match order: escaped braces '{{' or '}}', full tags '{...}', square vars '[...]',
-    # Ren'Py qmark placeholders (?V000?, ?T000?) and angled placeholders (⟦V000⟧)
-    combined = re.compile(
-        r'(\{\{|\}\}|\{[^\}]+\}|\[[^\[\]]+\]|'
-        r'\?[A-Za-z]\d{3}\?|'
-        r'\u27e6[^\u27e7]+\u27e7)'
-    )
     out_parts: List[str] = []
     last = 0
-    for m in combined.finditer(text):
+    for m in RENPY_PROTECT_RE.finditer(text):
         start, end = m.start(), m.end()
         # Append text between matches
         out_parts.append(text[last:start])
@@ -797,7 +799,7 @@ class PseudoTranslator(BaseTranslator):
         
         # Split by placeholders (both Ren'Py and Glossary ones)
         # Pattern matches XRPYX...XRPYX
-        parts = re.split(r'(XRPYX[A-Z0-9]+XRPYX)', protected_text)
+        parts = PLACEHOLDER_SPLIT_RE.split(protected_text)
         new_parts = []
         for part in parts:
             if part.startswith('XRPYX') and part.endswith('XRPYX'):
@@ -13,11 +13,19 @@ This helps when:
 """
 
 import logging
+import math
+from bisect import bisect_left, bisect_right
 from difflib import SequenceMatcher
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Set
 from pathlib import Path
 
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 
 @dataclass
 class FuzzyMatch:
@@ -28,6 +36,7 @@ class FuzzyMatch:
     old_original: str
     old_translation: str
     similarity: float  # 0.0 to 1.0
+    confident: bool = False  # similarity >= the matcher's auto_threshold, set once
     
     @property
     def similarity_percent(self) -> int:
@@ -50,16 +59,17 @@ class FuzzyMatchReport:
     matches: List[FuzzyMatch] = field(default_factory=list)
     unmatched_new: List[Tuple[str, str]] = field(default_factory=list)  # (id, text)
     unmatched_old: List[Tuple[str, str, str]] = field(default_factory=list)  # (id, orig, trans)
+    auto_threshold: float = 0.9
     
     @property
     def auto_apply_count(self) -> int:
         """Number of matches confident enough to auto-apply."""
-        return sum(1 for m in self.matches if m.is_confident())
+        return sum(1 for m in self.matches if m.confident)
     
     @property
     def review_count(self) -> int:
         """Number of matches that need human review."""
-        return sum(1 for m in self.matches if not m.is_confident())
+        return len(self.matches) - self.auto_apply_count
     
     def get_suggestions(self, auto_threshold: float = 0.9) -> Dict[str, str]:
         """
@@ -75,21 +85,53 @@ class FuzzyMatchReport:
         }
     
     def summary(self) -> str:
+        auto_count = self.auto_apply_count
+        percent = f"{self.auto_threshold * 100:.0f}%"
         return (
             f"Fuzzy Match Results:\n"
-            f"  Auto-apply (≥90%): {self.auto_apply_count}\n"
-            f"  Needs review (<90%): {self.review_count}\n"
+            f"  Auto-apply (≥{percent}): {auto_count}\n"
+            f"  Needs review (<{percent}): {len(self.matches) - auto_count}\n"
             f"  Unmatched new strings: {len(self.unmatched_new)}\n"
             f"  Orphaned old translations: {len(self.unmatched_old)}"
         )
 
 
+class _LengthWindowIndex:
+    """
+    Old originals sorted by length, for pruning fuzzy candidates losslessly.
+    
+    Two strings of lengths a and b can reach a similarity ratio of t at most
+    when ``2 * min(a, b) / (a + b) >= t``, so a query only needs scoring
+    against the slice of candidates whose length satisfies that bound.
+    """
+    
+    def __init__(self, normalized: Dict[str, str]):
+        items = sorted(normalized.items(), key=lambda item: len(item[1]))
+        self.ids = [old_id for old_id, _ in items]
+        self.texts: List[Optional[str]] = [text for _, text in items]
+        self.lengths = [len(text) for _, text in items]
+        self._positions = {old_id: i for i, old_id in enumerate(self.ids)}
+    
+    def window(self, length: int, threshold: float) -> Tuple[int, int]:
+        """Slice bounds of candidates that can reach ``threshold`` for a query of ``length``."""
+        if threshold <= 0:
+            return 0, len(self.ids)
+        shortest = math.ceil(length * threshold / (2 - threshold) - 1e-9)
+        longest = math.floor(length * (2 - threshold) / threshold + 1e-9)
+        return bisect_left(self.lengths, shortest), bisect_right(self.lengths, longest)
+    
+    def remove(self, old_id: str):
+        """Drop a matched candidate (rapidfuzz skips None choices)."""
+        self.texts[self._positions[old_id]] = None
+
+
 class FuzzyMatcher:
     """
     Fuzzy string matcher for recovering translations.
     
-    Uses SequenceMatcher (similar to diff algorithm) to find similar strings
-    and map old translations to new source strings.
+    Uses rapidfuzz's Indel ratio (C implementation) when installed, otherwise
+    SequenceMatcher (similar to diff algorithm), to find similar strings and
+    map old translations to new source strings.
     """
     
     def __init__(
@@ -136,6 +178,9 @@ class FuzzyMatcher:
         if norm1 == norm2:
             return 1.0
         
+        if RAPIDFUZZ_AVAILABLE:
+            return rf_fuzz.ratio(norm1, norm2) / 100.0
+        
         # Use SequenceMatcher for efficient similarity calculation
         matcher = SequenceMatcher(None, norm1, norm2)
         return matcher.ratio()
@@ -178,6 +223,37 @@ class FuzzyMatcher:
         
         return None
     
+    def _find_best_unmatched(
+        self,
+        target: str,
+        index: _LengthWindowIndex,
+        old_entries: Dict[str, Tuple[str, str]]
+    ) -> Optional[FuzzyMatch]:
+        """rapidfuzz version of find_best_match over the not yet matched old entries."""
+        query = self._normalize(target)
+        start, end = index.window(len(query), self.min_threshold)
+        if start >= end:
+            return None
+        
+        best = rf_process.extractOne(
+            query, index.texts[start:end], scorer=rf_fuzz.ratio, processor=None,
+            score_cutoff=self.min_threshold * 100
+        )
+        if best is None:
+            return None
+        
+        _, score, position = best
+        old_id = index.ids[start + position]
+        old_original, old_translation = old_entries[old_id]
+        return FuzzyMatch(
+            new_id="",  # Will be set by caller
+            new_original=target,
+            old_id=old_id,
+            old_original=old_original,
+            old_translation=old_translation,
+            similarity=score / 100.0
+        )
+    
     def match_translations(
         self,
         new_entries: Dict[str, str],  # new_id -> new_original
@@ -193,44 +269,60 @@ class FuzzyMatcher:
         Returns:
             FuzzyMatchReport with all matches and unmatched items
         """
-        report = FuzzyMatchReport()
+        report = FuzzyMatchReport(auto_threshold=self.auto_threshold)
         
         # Track which old entries have been matched
         matched_old_ids: Set[str] = set()
         
-        # Try to find matches for each new entry
+        # Exact pass first: index old entries by original text so identical
+        # lines (menus, repeated dialogue) never reach the fuzzy scorer
+        exact_index: Dict[str, List[str]] = {}
+        for old_id, (old_original, _) in old_entries.items():
+            exact_index.setdefault(old_original, []).append(old_id)
+        
+        fuzzy_candidates: List[Tuple[str, str]] = []
         for new_id, new_original in new_entries.items():
-            # Check for exact match first (same original text)
-            exact_match = None
-            for old_id, (old_original, old_translation) in old_entries.items():
-                if old_original == new_original and old_id not in matched_old_ids:
-                    exact_match = FuzzyMatch(
-                        new_id=new_id,
-                        new_original=new_original,
-                        old_id=old_id,
-                        old_original=old_original,
-                        old_translation=old_translation,
-                        similarity=1.0
-                    )
-                    matched_old_ids.add(old_id)
-                    break
-            
-            if exact_match:
-                report.matches.append(exact_match)
-                continue
-            
+            old_ids = exact_index.get(new_original)
+            if old_ids:
+                old_id = old_ids.pop(0)
+                old_original, old_translation = old_entries[old_id]
+                report.matches.append(FuzzyMatch(
+                    new_id=new_id,
+                    new_original=new_original,
+                    old_id=old_id,
+                    old_original=old_original,
+                    old_translation=old_translation,
+                    similarity=1.0
+                ))
+                matched_old_ids.add(old_id)
+            else:
+                fuzzy_candidates.append((new_id, new_original))
+        
+        # Normalize the remaining old originals once and index them by length
+        if RAPIDFUZZ_AVAILABLE:
+            index = _LengthWindowIndex({
+                old_id: self._normalize(old_original)
+                for old_id, (old_original, _) in old_entries.items()
+                if old_id not in matched_old_ids
+            })
+        
+        for new_id, new_original in fuzzy_candidates:
             # No exact match, try fuzzy matching
             # Only consider unmatched old entries
-            available_candidates = {
-                k: v for k, v in old_entries.items()
-                if k not in matched_old_ids
-            }
-            
-            match = self.find_best_match(new_original, available_candidates)
+            if RAPIDFUZZ_AVAILABLE:
+                match = self._find_best_unmatched(new_original, index, old_entries)
+            else:
+                available_candidates = {
+                    k: v for k, v in old_entries.items()
+                    if k not in matched_old_ids
+                }
+                match = self.find_best_match(new_original, available_candidates)
             
             if match:
                 match.new_id = new_id
                 matched_old_ids.add(match.old_id)
+                if RAPIDFUZZ_AVAILABLE:
+                    index.remove(match.old_id)
                 report.matches.append(match)
             else:
                 report.unmatched_new.append((new_id, new_original))
@@ -243,6 +335,9 @@ class FuzzyMatcher:
         # Sort matches by similarity (highest first)
         report.matches.sort(key=lambda m: m.similarity, reverse=True)
         
+        for match in report.matches:
+            match.confident = match.similarity >= self.auto_threshold
+        
         return report
     
     def suggest_translations(
@@ -0,0 +1,36 @@
+from src.cli_main import _rewrite_tl_file
+
+
+def test_rewrite_fills_untranslated_blocks_only():
+    content = """translate turkish start_1234:
+
+    # "Hello"
+    "Hello"
+
+translate turkish done_5678:
+
+    # "Bye"
+    "Zaten çevrildi"
+
+translate turkish strings:
+
+    old "Start \\"Game\\""
+    new "Start \\"Game\\""
+"""
+    replacements = {
+        "Hello": "Merhaba",
+        "Bye": "Hoşça kal",
+        'Start \\"Game\\"': 'Oyunu \\"Başlat\\"',
+    }
+
+    updated, count = _rewrite_tl_file(content, replacements)
+
+    assert count == 2
+    assert '    "Merhaba"' in updated
+    assert '"Zaten çevrildi"' in updated
+    assert 'new "Oyunu \\"Başlat\\""' in updated
+
+
+def test_rewrite_without_matches_returns_content_unchanged():
+    content = 'translate turkish strings:\n    old "A"\n    new "B"\n'
+    assert _rewrite_tl_file(content, {"X": "Y"}) == (content, 0)
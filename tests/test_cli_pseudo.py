@@ -0,0 +1,106 @@
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from src.cli_main import _pseudo_one_file
+from src.core.translator import PseudoTranslator
+
+
+def test_pseudo_one_file_rewrites_dialogue_only(tmp_path: Path):
+    src_dir = tmp_path / "game"
+    out_dir = tmp_path / "out"
+    src_dir.mkdir()
+    out_dir.mkdir()
+    script = src_dir / "script.rpy"
+    script.write_text(
+        'label start:\n'
+        '    e   "Hello"\n'
+        '    "Narration"\n'
+        '    $ name = "Eileen" + ""\n'
+        '    ""\n',
+        encoding="utf-8",
+    )
+
+    rel_path, count, error = _pseudo_one_file(str(script), str(src_dir), str(out_dir), "expand")
+
+    assert (rel_path, count, error) == ("script.rpy", 2, None)
+    assert (out_dir / "script.rpy").read_text(encoding="utf-8") == (
+        'label start:\n'
+        '    e "[!!! Hello !!!]"\n'
+        '    "[!!! Narration !!!]"\n'
+        '    $ name = "Eileen" + ""\n'
+        '    ""\n'
+    )
+
+
+def test_pseudo_one_file_non_ascii_speaker(tmp_path: Path):
+    script = tmp_path / "script.rpy"
+    script.write_text('    ş "Merhaba dünya"\n    艾琳 "你好"\n    e "Hello"\n', encoding="utf-8")
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    assert _pseudo_one_file(str(script), str(tmp_path), str(out_dir), "expand") == ("script.rpy", 3, None)
+    assert (out_dir / "script.rpy").read_text(encoding="utf-8") == (
+        '    ş "[!!! Merhaba dünya !!!]"\n'
+        '    艾琳 "[!!! 你好 !!!]"\n'
+        '    e "[!!! Hello !!!]"\n'
+    )
+
+
+def test_pseudo_one_file_failure_keeps_previous_output(tmp_path: Path):
+    script = tmp_path / "script.rpy"
+    # Invalid UTF-8 in the second line makes the transform fail mid-file
+    script.write_bytes(b'    e "Hello"\n    e "\xff\xfe"\n')
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (out_dir / "script.rpy").write_text("previous\n", encoding="utf-8")
+
+    rel_path, count, error = _pseudo_one_file(str(script), str(tmp_path), str(out_dir), "both")
+
+    assert (rel_path, count) == ("script.rpy", 0)
+    assert error
+    assert (out_dir / "script.rpy").read_text(encoding="utf-8") == "previous\n"
+    assert [p.name for p in out_dir.iterdir()] == ["script.rpy"]
+
+
+def test_pseudo_one_file_empty_source(tmp_path: Path):
+    script = tmp_path / "script.rpy"
+    script.write_bytes(b"")
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    assert _pseudo_one_file(str(script), str(tmp_path), str(out_dir), "expand") == ("script.rpy", 0, None)
+    assert [p.name for p in out_dir.iterdir()] == ["script.rpy"]
+    assert (out_dir / "script.rpy").read_bytes() == b""
+
+
+@pytest.mark.parametrize("mode", ["expand", "both"])
+def test_pseudo_one_file_matches_dialogue_regex(tmp_path: Path, mode):
+    # The scanner must agree with the original line regex, including
+    # non-ASCII speakers and whitespace. (The original let the speaker sit on
+    # the line above the quote and joined the two lines; the scanner keeps
+    # speaker and quote on one line, so the reference does too.)
+    dialogue_re = re.compile(r'^(\s*)(\w+)?[^\S\n]*"([^"]+)"', re.MULTILINE)
+    translator = PseudoTranslator(mode=mode)
+    pieces = ['e', 'ş', '艾琳', 'Ölçü', ' ', ' ', '　', '\t', '\n', '"', 'x', 'ğ', '—', '“', '\xa0', '$', '=', '()']
+    rng = random.Random(1)
+    content = ''.join(rng.choice(pieces) for _ in range(4000))
+    script = tmp_path / "script.rpy"
+    script.write_text(content, encoding="utf-8")
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        count += 1
+        indent, speaker, text = match.group(1), match.group(2), match.group(3)
+        pseudo = translator._pseudo_transform(text)
+        return f'{indent}{speaker} "{pseudo}"' if speaker else f'{indent}"{pseudo}"'
+
+    expected = dialogue_re.sub(replace, content)
+    assert _pseudo_one_file(str(script), str(tmp_path), str(out_dir), mode) == ("script.rpy", count, None)
+    assert (out_dir / "script.rpy").read_text(encoding="utf-8") == expected
@@ -0,0 +1,23 @@
+import json
+
+import pytest
+
+from src.core import diagnostics
+from src.core.diagnostics import DiagnosticReport
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_round_trips_report(tmp_path, monkeypatch, use_orjson):
+    if use_orjson and not diagnostics.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(diagnostics, "ORJSON_AVAILABLE", use_orjson)
+
+    report = DiagnosticReport(project="demo", target_language="turkish")
+    report.add_extracted("game/script.rpy", {"text": "Merhaba \"dünya\"", "line": 3})
+    report.mark_translated("game/script.rpy", "id_1", "Hello", original_text="Merhaba")
+    report.mark_skipped("game/gui.rpy", "technical")
+
+    out = tmp_path / "reports" / "diag.json"
+    report.write(str(out))
+
+    assert json.loads(out.read_text(encoding="utf-8")) == report.to_dict()
@@ -0,0 +1,68 @@
+import pytest
+
+from src.tools import fuzzy_matcher
+from src.tools.fuzzy_matcher import FuzzyMatcher
+
+OLD = {
+    "o1": ("Hello there, friend!", "Merhaba dostum!"),
+    "o2": ("Start Game", "Oyunu Başlat"),
+    "o3": ("Completely unrelated line", "Alakasız"),
+}
+NEW = {
+    "n1": "Start Game",
+    "n2": "Hello there friend!",
+    "n3": "Hello there, friend?",
+    "n4": "Something new",
+}
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_match_translations_backends_agree(monkeypatch, use_rapidfuzz):
+    if use_rapidfuzz and not fuzzy_matcher.RAPIDFUZZ_AVAILABLE:
+        pytest.skip("rapidfuzz not installed")
+    monkeypatch.setattr(fuzzy_matcher, "RAPIDFUZZ_AVAILABLE", use_rapidfuzz)
+
+    report = FuzzyMatcher(min_threshold=0.7).match_translations(NEW, OLD)
+    by_new = {m.new_id: m for m in report.matches}
+
+    assert by_new["n1"].old_id == "o2" and by_new["n1"].similarity == 1.0
+    # o1 is taken by the first fuzzy match, so n3 gets nothing above threshold
+    assert by_new["n2"].old_id == "o1"
+    assert by_new["n2"].similarity == pytest.approx(0.974, abs=1e-3)
+    assert [i for i, _ in report.unmatched_new] == ["n3", "n4"]
+    assert [o[0] for o in report.unmatched_old] == ["o3"]
+
+
+@pytest.mark.parametrize("use_rapidfuzz", [True, False])
+def test_exact_match_wins_over_earlier_fuzzy_match(monkeypatch, use_rapidfuzz):
+    if use_rapidfuzz and not fuzzy_matcher.RAPIDFUZZ_AVAILABLE:
+        pytest.skip("rapidfuzz not installed")
+    monkeypatch.setattr(fuzzy_matcher, "RAPIDFUZZ_AVAILABLE", use_rapidfuzz)
+
+    new = {"n0": "Hello there friend!", "n1": "Hello there, friend!"}
+    report = FuzzyMatcher().match_translations(new, {"o1": OLD["o1"]})
+
+    assert [(m.new_id, m.old_id, m.similarity) for m in report.matches] == [("n1", "o1", 1.0)]
+    assert report.unmatched_new == [("n0", "Hello there friend!")]
+
+
+def test_length_window_keeps_every_reachable_candidate():
+    texts = {f"o{n}": "a" * n for n in range(1, 60)}
+    index = fuzzy_matcher._LengthWindowIndex(texts)
+    for threshold in (0.7, 0.8, 0.9, 1.0):
+        for length in (1, 7, 20, 33):
+            start, end = index.window(length, threshold)
+            kept = set(index.lengths[start:end])
+            reachable = {n for n in range(1, 60) if 2 * min(n, length) / (n + length) >= threshold}
+            assert kept == reachable
+
+
+def test_confidence_follows_matcher_threshold():
+    new = {"n1": "Start Game", "n2": "Hello there friend!"}
+    strict = FuzzyMatcher(auto_threshold=0.99).match_translations(new, OLD)
+    loose = FuzzyMatcher(auto_threshold=0.95).match_translations(new, OLD)
+
+    assert [m.confident for m in strict.matches] == [True, False]
+    assert (strict.auto_apply_count, strict.review_count) == (1, 1)
+    assert loose.auto_apply_count == 2
+    assert "Auto-apply (≥95%): 2" in loose.summary()
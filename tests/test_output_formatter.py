@@ -0,0 +1,132 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.output_formatter import RenPyOutputFormatter
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('Say "hi"\n', 'Say \\"hi\\"\\n'),
+    ('a\\b\tc\r', 'a\\\\b\\tc'),
+    ('[player!t] {b}"won"{/b}', '[player!t] {b}\\"won\\"{/b}'),
+    ('{#menu}Start', '{#menu}Start'),
+    ('[[ and {{', '\\\\[\\\\[ and \\\\{\\\\{'),
+    ('[[name]', '[[name]'),
+    ('', ''),
+])
+def test_escape_renpy_string(text, expected):
+    assert RenPyOutputFormatter().escape_renpy_string(text) == expected
+
+
+def test_find_game_directory_does_not_cache_misses(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    f = RenPyOutputFormatter()
+
+    assert f._find_game_directory(project) is None
+    # e.g. UnRen run in between: the next lookup must see the new folder
+    (project / "game").mkdir()
+    assert f._find_game_directory(project) == (project / "game").resolve()
+
+
+def test_find_game_directory_cache_is_per_formatter(tmp_path):
+    project = tmp_path / "project"
+    (project / "game").mkdir(parents=True)
+    first = RenPyOutputFormatter()
+    assert first._find_game_directory(project) == (project / "game").resolve()
+
+    (project / "game").rmdir()
+    # a new formatter (a new pipeline run) searches again
+    assert RenPyOutputFormatter()._find_game_directory(project) is None
+    first.invalidate_cache()
+    assert first._find_game_directory(project) is None
+
+
+def test_find_game_directory_parent_needs_renpy_markers(tmp_path):
+    game = tmp_path / "project" / "game"
+    (game / "tl").mkdir(parents=True)
+    f = RenPyOutputFormatter()
+
+    assert f._find_game_directory(game / "tl") is None
+    (game / "script.rpy").write_text("label start:\n", encoding="utf-8")
+    assert f._find_game_directory(game / "tl") == game.resolve()
+
+
+def test_find_game_directory_shares_walk_with_passed_folders(tmp_path, monkeypatch):
+    game = tmp_path / "project" / "game"
+    deep = game / "tl" / "turkish"
+    deep.mkdir(parents=True)
+    (game / "options.rpy").write_text("", encoding="utf-8")
+    f = RenPyOutputFormatter()
+
+    assert f._find_game_directory(deep) == game.resolve()
+    monkeypatch.setattr(RenPyOutputFormatter, "_search_game_directory", None)
+    assert f._find_game_directory(game / "tl") == game.resolve()
+
+
+@pytest.mark.parametrize("env_var", RenPyOutputFormatter.GAME_DIR_ENV_VARS)
+def test_find_game_directory_env_override(tmp_path, monkeypatch, env_var):
+    project = tmp_path / "elsewhere"
+    game = project / "game"
+    game.mkdir(parents=True)
+    f = RenPyOutputFormatter()
+
+    # the project folder or the game folder itself
+    monkeypatch.setenv(env_var, str(project))
+    assert f._find_game_directory(tmp_path) == game
+    monkeypatch.setenv(env_var, str(game))
+    assert f._find_game_directory(tmp_path) == game
+    # a stale override (folder gone) falls back to the search
+    monkeypatch.setenv(env_var, str(tmp_path / "missing"))
+    assert f._find_game_directory(tmp_path) is None
+
+
+def test_apply_glossary_whole_words_longest_first():
+    glossary = {"Save": "Kaydet", "Quick Save": "Hızlı Kayıt", "HP": "Can"}
+    f = RenPyOutputFormatter()
+
+    assert f.apply_glossary("Quick Save or SAVE, saved hp", glossary) == "Hızlı kayıt or KAYDET, saved Can"
+    assert f.apply_glossary("anything", glossary, original_text=" quick save ") == "Hızlı Kayıt"
+    # keys differing only in case: the first one wins, as before
+    assert f.apply_glossary("x", {"Save": "Kaydet", "SAVE": "KAYIT"}, original_text="save") == "Kaydet"
+
+
+def test_apply_glossary_precheck_keeps_regex_case_matches():
+    # re's IGNORECASE equates İ/ı with i; the substring pre-check must too
+    glossary = {"İstanbul": "Istanbul", "ışık": "light"}
+    f = RenPyOutputFormatter()
+
+    assert f.apply_glossary("istanbul, IŞIK", glossary) == "Istanbul, LIGHT"
+    assert f.apply_glossary("no terms here", glossary) == "no terms here"
+
+
+def test_organize_output_files_keeps_first_of_each_string(tmp_path):
+    results = [
+        SimpleNamespace(success=True, original_text=text, translated_text=tr, metadata={})
+        for text, tr in [("Start", "Başla"), ("Cafeteria", "Kafeterya"), (" Start ", "Başlat"),
+                         ("cafeteria", "kafeterya")]
+    ]
+    f = RenPyOutputFormatter()
+
+    [path] = f.organize_output_files(results, tmp_path, "turkish",
+                                     output_format="simple", create_renpy_structure=False)
+    content = path.read_text(encoding="utf-8-sig")
+
+    assert content.index('new "Başla"') < content.index('new "Kafeterya"') < content.index('new "kafeterya"')
+    assert 'new "Başlat"' not in content
+
+
+def test_language_init_file_not_rewritten_when_unchanged(tmp_path):
+    f = RenPyOutputFormatter()
+    init_file = tmp_path / "a0_turkish_language.rpy"
+
+    f._create_language_init_file(tmp_path, "turkish")
+    assert init_file.read_bytes() == b'\xef\xbb\xbfdefine config.language = "turkish"\n'
+    os.utime(init_file, (0, 0))
+    f._create_language_init_file(tmp_path, "turkish")
+    assert init_file.stat().st_mtime == 0
+
+    init_file.write_text('define config.language = "english"\n', encoding="utf-8")
+    f._create_language_init_file(tmp_path, "turkish")
+    assert init_file.read_bytes() == b'\xef\xbb\xbfdefine config.language = "turkish"\n'
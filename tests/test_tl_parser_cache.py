@@ -0,0 +1,52 @@
+import os
+import time
+from pathlib import Path
+
+from src.core import tl_parser_cache
+from src.core.tl_parser import TLParser
+
+
+def test_cache_reused_until_file_changes(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(tl_parser_cache, "get_cache_dir", lambda: tmp_path / "cache")
+    tl_file = tmp_path / "strings.rpy"
+    tl_file.write_text('translate turkish strings:\n    old "Hello"\n    new ""\n', encoding="utf-8")
+
+    parser = TLParser()
+    calls = []
+    real_parse = parser.parse_file
+    monkeypatch.setattr(parser, "parse_file", lambda path: calls.append(path) or real_parse(path))
+
+    first = tl_parser_cache.load_or_parse(parser, str(tl_file))
+    second = tl_parser_cache.load_or_parse(parser, str(tl_file))
+    assert len(calls) == 1
+    assert second.entries[0].original_text == first.entries[0].original_text == "Hello"
+
+    tl_file.write_text('translate turkish strings:\n    old "Hello"\n    new "Merhaba"\n', encoding="utf-8")
+    st = os.stat(tl_file)
+    os.utime(tl_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    third = tl_parser_cache.load_or_parse(parser, str(tl_file))
+    assert len(calls) == 2
+    assert third.entries[0].translated_text == "Merhaba"
+
+
+def test_store_prunes_old_and_excess_entries(tmp_path: Path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(tl_parser_cache, "get_cache_dir", lambda: cache_dir)
+    monkeypatch.setattr(tl_parser_cache, "_pruned_dirs", set())
+    monkeypatch.setattr(tl_parser_cache, "CACHE_MAX_ENTRIES", 2)
+
+    now = time.time()
+    ages = {"stale.pkl": 40, "stale.123.tmp": 40, "old.pkl": 3, "mid.pkl": 2, "new.pkl": 1}
+    for name, days in ages.items():
+        path = cache_dir / name
+        path.write_bytes(b"")
+        os.utime(path, (now - days * 86400, now - days * 86400))
+
+    tl_file = tmp_path / "strings.rpy"
+    tl_file.write_text('translate turkish strings:\n    old "Hello"\n    new ""\n', encoding="utf-8")
+    tl_parser_cache.load_or_parse(TLParser(), str(tl_file))
+
+    cache_entry = tl_parser_cache._cache_path(str(tl_file)).name
+    assert sorted(p.name for p in cache_dir.iterdir()) == sorted(["mid.pkl", "new.pkl", cache_entry])